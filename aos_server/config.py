@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, SecretStr, ValidationError
+from pydantic import BaseModel, Field, SecretStr, ValidationError, model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -156,6 +156,35 @@ class SSHConfig(BaseModel):
     # Keepalive
     keepalive_s: Optional[int] = 30
 
+    # Commands run_batch executes concurrently, each on its own channel of one
+    # connection (1 = sequential). Keep within the device's per-connection session
+    # limit; must not exceed max_channels_per_connection.
+    max_parallel_channels: int = Field(default=1, ge=1)
+    # Concurrent channels allowed to a single switch across all tool calls;
+    # further calls wait up to connect_timeout_s for a free slot.
+    max_parallel_per_host: int = Field(default=8, ge=1)
+
+    # Keep authenticated connections open and reuse them across tool calls.
+    # A connection carries at most max_channels_per_connection concurrent channels
+    # (stay below the device's MaxSessions); more load opens another connection.
+    pool_connections: bool = False
+    max_channels_per_connection: int = Field(default=8, ge=1)
+    # Close pooled connections unused for this long (keep below the switch's CLI
+    # session timeout); None keeps them until they break.
+    pool_idle_timeout_s: Optional[int] = 180
+    # Upper bound on pooled connections across all switches; beyond it the least
+    # recently used idle connections are closed.
+    pool_max_connections: int = Field(default=64, ge=1)
+
+    @model_validator(mode="after")
+    def _check_channel_bounds(self) -> "SSHConfig":
+        if self.max_parallel_channels > self.max_channels_per_connection:
+            raise ValueError(
+                f"ssh.max_parallel_channels ({self.max_parallel_channels}) must not exceed "
+                f"ssh.max_channels_per_connection ({self.max_channels_per_connection})"
+            )
+        return self
+
 
 class CommandPolicyConfig(BaseModel):
     # Commands must match at least one allow regex and must match none of the deny regex.
@@ -208,6 +237,18 @@ class AuthzConfig(BaseModel):
     enforce_device_authorization: bool = True
 
 
+class CacheConfig(BaseModel):
+    """In-memory caching of tool results (off by default)."""
+
+    # Serve repeated calls of read-only audit tools from memory for their
+    # "cacheable_ttl_s"; tools that may change switch state flush the host.
+    tool_results: bool = False
+    # Longest max_age_s honoured by aos.config.backup; a capture is only kept in
+    # memory when the caller asks for reuse, and never longer than this.
+    # 0 disables reuse (backups are always read fresh and never stored).
+    config_backup_max_age_s: int = Field(default=0, ge=0, le=3600)
+
+
 class AppConfig(BaseModel):
     ssh: SSHConfig = Field(default_factory=SSHConfig)
     inventory: InventoryConfig = Field(default_factory=InventoryConfig)
@@ -215,6 +256,7 @@ class AppConfig(BaseModel):
     templates: TemplatesConfig = Field(default_factory=TemplatesConfig)
     facts: FactsConfig = Field(default_factory=FactsConfig)
     authz: AuthzConfig = Field(default_factory=AuthzConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
     zone_auth: Optional[ZoneAuthConfig] = None
 
 
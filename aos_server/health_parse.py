@@ -15,6 +15,28 @@ from __future__ import annotations
 import re
 from typing import Any, Dict, List, Optional
 
+# 'show health' (OS6860 CMM Resources table) and AOS8 module rows
+_HEALTH_CPU_RE = re.compile(r'^CPU\s+(\d+)')
+_HEALTH_MEMORY_RE = re.compile(r'^Memory\s+(\d+)')
+_HEALTH_MODULE_RE = re.compile(r'(\w+)\s+(\d+/?\d*)\s+(OK|WARNING|CRITICAL|DOWN)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)')
+
+# 'show chassis' values
+_CHASSIS_VALUE_RE = re.compile(r':\s*(.+?)(?:,|$)')
+_CHASSIS_TOKEN_RE = re.compile(r':\s*(\S+)')
+_CHASSIS_MAC_RE = re.compile(r':\s*([0-9a-fA-F:]+)')
+
+# 'show temperature' rows (OS6860, AOS8)
+_TEMP_OS6860_RE = re.compile(r'(\d+/\w+)\s+(\d+)\s+\d+\s+to\s+\d+\s+\d+\s+(\d+)\s+(UNDER THRESHOLD|OVER THRESHOLD|OK)', re.IGNORECASE)
+_TEMP_AOS8_RE = re.compile(r'(\w+[-\w]*)\s+([\w/]+)\s+(\d+)C?\s+(\d+)C?\s+(OK|WARNING|CRITICAL)', re.IGNORECASE)
+
+# 'show fan' rows (OS6860, AOS8)
+_FAN_OS6860_RE = re.compile(r'(\d+)/[-\w]*\s+(\d+)\s+(YES|NO)', re.IGNORECASE)
+_FAN_AOS8_RE = re.compile(r'(?:Fan|FAN)\s+(\d+)\s+(\d+)\s*(RPM)?\s+(OK|WARNING|CRITICAL|FAILED|operational|not operational)', re.IGNORECASE)
+
+# 'show power-supply' and 'show cmm' rows
+_PSU_RE = re.compile(r'(?:PSU|PS|Power Supply)\s+(\d+)\s+(present|not present|operational|failed)\s+(AC|DC)?\s*(\d+)?', re.IGNORECASE)
+_CMM_RE = re.compile(r'(?:Slot|CMM)\s+(\d+)\s+(primary|secondary|running|standby)\s+(running|standby|up|down)\s*(\d+)?', re.IGNORECASE)
+
 
 def parse_show_health(output: str) -> Dict[str, Any]:
     """
@@ -32,7 +54,7 @@ def parse_show_health(output: str) -> Dict[str, Any]:
         "issues": []
     }
     
-    lines = output.strip().split('\n')
+    lines = output.splitlines()
     
     # Detect OS6860 format: CMM Resources table
     if "Resources" in output and "Current" in output:
@@ -41,12 +63,12 @@ def parse_show_health(output: str) -> Dict[str, Any]:
         
         for line in lines:
             # CPU line: "CPU                     38       40      32      31"
-            cpu_match = re.search(r'^CPU\s+(\d+)', line)
+            cpu_match = _HEALTH_CPU_RE.search(line)
             if cpu_match:
                 cpu_usage = int(cpu_match.group(1))
             
             # Memory line: "Memory                  10       10      10      10"
-            memory_match = re.search(r'^Memory\s+(\d+)', line)
+            memory_match = _HEALTH_MEMORY_RE.search(line)
             if memory_match:
                 memory_usage = int(memory_match.group(1))
         
@@ -74,7 +96,7 @@ def parse_show_health(output: str) -> Dict[str, Any]:
     else:
         # AOS8 chassis format: Module   Slot   Status   CPU%   Memory%   RX Errors   TX Errors
         for line in lines:
-            match = re.search(r'(\w+)\s+(\d+/?\d*)\s+(OK|WARNING|CRITICAL|DOWN)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)', line)
+            match = _HEALTH_MODULE_RE.search(line)
             if match:
                 module_name, slot, status, cpu, memory, rx_errors, tx_errors = match.groups()
                 
@@ -119,30 +141,30 @@ def parse_show_chassis(output: str) -> Dict[str, Any]:
         "modules": []
     }
     
-    lines = output.strip().split('\n')
+    lines = output.splitlines()
     
     for line in lines:
         # Chassis type
         if 'Chassis Type' in line or 'Model Name' in line:
-            match = re.search(r':\s*(.+?)(?:,|$)', line)
+            match = _CHASSIS_VALUE_RE.search(line)
             if match:
                 result["chassis_type"] = match.group(1).strip()
         
         # Serial number
         if 'Serial Number' in line:
-            match = re.search(r':\s*(\S+)', line)
+            match = _CHASSIS_TOKEN_RE.search(line)
             if match:
                 result["serial_number"] = match.group(1).strip().rstrip(',')
         
         # Hardware revision
         if 'Hardware Revision' in line:
-            match = re.search(r':\s*(\S+)', line)
+            match = _CHASSIS_TOKEN_RE.search(line)
             if match:
                 result["hardware_revision"] = match.group(1).strip().rstrip(',')
         
         # MAC address
         if 'MAC Address' in line or 'Base MAC' in line:
-            match = re.search(r':\s*([0-9a-fA-F:]+)', line)
+            match = _CHASSIS_MAC_RE.search(line)
             if match:
                 result["mac_address"] = match.group(1).strip()
     
@@ -165,11 +187,11 @@ def parse_show_temperature(output: str) -> Dict[str, Any]:
         "issues": []
     }
     
-    lines = output.strip().split('\n')
+    lines = output.splitlines()
     
     for line in lines:
         # OS6860 format: "1/CMMA            38       15 to 85      88       85     UNDER THRESHOLD"
-        os6860_match = re.search(r'(\d+/\w+)\s+(\d+)\s+\d+\s+to\s+\d+\s+\d+\s+(\d+)\s+(UNDER THRESHOLD|OVER THRESHOLD|OK)', line, re.IGNORECASE)
+        os6860_match = _TEMP_OS6860_RE.search(line)
         if os6860_match:
             location, current, threshold, status = os6860_match.groups()
             
@@ -189,7 +211,7 @@ def parse_show_temperature(output: str) -> Dict[str, Any]:
             continue
         
         # AOS8 format: "Sensor   Location   Current   Threshold   Status"
-        aos8_match = re.search(r'(\w+[-\w]*)\s+([\w/]+)\s+(\d+)C?\s+(\d+)C?\s+(OK|WARNING|CRITICAL)', line, re.IGNORECASE)
+        aos8_match = _TEMP_AOS8_RE.search(line)
         if aos8_match:
             sensor_name, location, current, threshold, status = aos8_match.groups()
             
@@ -222,11 +244,11 @@ def parse_show_fan(output: str) -> List[Dict[str, Any]]:
     """
     fans = []
     
-    lines = output.strip().split('\n')
+    lines = output.splitlines()
     
     for line in lines:
         # OS6860 format: "1/--         1       YES"
-        os6860_match = re.search(r'(\d+)/[-\w]*\s+(\d+)\s+(YES|NO)', line, re.IGNORECASE)
+        os6860_match = _FAN_OS6860_RE.search(line)
         if os6860_match:
             chassis, fan_id, functional = os6860_match.groups()
             
@@ -240,7 +262,7 @@ def parse_show_fan(output: str) -> List[Dict[str, Any]]:
             continue
         
         # AOS8 format: "Fan ID   Speed (RPM)   Status"
-        aos8_match = re.search(r'(?:Fan|FAN)\s+(\d+)\s+(\d+)\s*(RPM)?\s+(OK|WARNING|CRITICAL|FAILED|operational|not operational)', line, re.IGNORECASE)
+        aos8_match = _FAN_AOS8_RE.search(line)
         if aos8_match:
             fan_id, speed, _, status = aos8_match.groups()
             
@@ -263,11 +285,11 @@ def parse_show_power_supply(output: str) -> List[Dict[str, Any]]:
     """
     power_supplies = []
     
-    lines = output.strip().split('\n')
+    lines = output.splitlines()
     
     for line in lines:
         # PSU format: PSU   Status   Type   Watts
-        match = re.search(r'(?:PSU|PS|Power Supply)\s+(\d+)\s+(present|not present|operational|failed)\s+(AC|DC)?\s*(\d+)?', line, re.IGNORECASE)
+        match = _PSU_RE.search(line)
         if match:
             psu_id, status, psu_type, watts = match.groups()
             
@@ -296,11 +318,11 @@ def parse_show_cmm(output: str) -> Dict[str, Any]:
         "status": "unknown"
     }
     
-    lines = output.strip().split('\n')
+    lines = output.splitlines()
     
     for line in lines:
         # CMM format: Slot   Role   Status   Temperature
-        match = re.search(r'(?:Slot|CMM)\s+(\d+)\s+(primary|secondary|running|standby)\s+(running|standby|up|down)\s*(\d+)?', line, re.IGNORECASE)
+        match = _CMM_RE.search(line)
         if match:
             slot, role, status, temp = match.groups()
             
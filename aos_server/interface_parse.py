@@ -4,6 +4,16 @@ from __future__ import annotations
 import re
 from typing import Dict
 
+# Data row of 'show interfaces status':
+#   1/1/4       en    en    1000   Full     -     DIS   Auto    Auto     -    AUTO  en   dis
+_STATUS_ROW_RE = re.compile(
+    r'\s*(\d+/\d+/\d+)\s+'  # Port ID
+    r'(\S+)\s+'              # Admin Status
+    r'(\S+)\s+'              # Auto Nego
+    r'(\S+)\s+'              # Speed (detected)
+    r'(\S+)'                 # Duplex (detected)
+)
+
 
 def parse_show_interfaces_detailed(output: str, port_id: str) -> Dict[str, any]:
     """
@@ -87,11 +97,12 @@ def parse_show_interfaces_detailed(output: str, port_id: str) -> Dict[str, any]:
     return result
 
 
-def parse_interfaces_status(output: str) -> Dict[str, Dict[str, str]]:
+def parse_interfaces_status(output: str, include_inactive: bool = True) -> Dict[str, Dict[str, str]]:
     """
     Parse 'show interfaces status' output.
     
-    Returns dict keyed by port_id with detected values.
+    Returns dict keyed by port_id with detected values. With
+    include_inactive=False, ports that are down are skipped while parsing.
     """
     interfaces = {}
     
@@ -109,25 +120,15 @@ def parse_interfaces_status(output: str) -> Dict[str, Dict[str, str]]:
             continue
         
         # Parse data lines
-        # Format: 1/1/4       en    en    1000   Full     -     DIS   Auto    Auto     -    AUTO  en   dis
-        match = re.match(
-            r'\s*(\d+/\d+/\d+)\s+'  # Port ID
-            r'(\S+)\s+'              # Admin Status
-            r'(\S+)\s+'              # Auto Nego
-            r'(\S+)\s+'              # Speed (detected)
-            r'(\S+)',                # Duplex (detected)
-            line
-        )
+        match = _STATUS_ROW_RE.match(line)
         
         if match:
-            port_id = match.group(1)
-            admin = match.group(2)
-            auto_neg = match.group(3)
-            speed = match.group(4)
-            duplex = match.group(5)
+            port_id, admin, auto_neg, speed, duplex = match.groups()
             
             # Determine operational state from speed
             # If speed is '-', port is down
+            if speed == '-' and not include_inactive:
+                continue
             oper_state = "up" if speed != '-' else "down"
             
             interfaces[port_id] = {
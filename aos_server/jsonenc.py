@@ -0,0 +1,24 @@
+"""JSON encoding for response payloads.
+
+Uses orjson, which is several times faster than the standard library on large
+payloads such as config backups.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize obj to a JSON string (two-space indented if requested)."""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, option=option).decode("utf-8")
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON, ready to use as an HTTP response body."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
@@ -173,7 +173,7 @@ def analyze_lacp_issues(lacp_data: Dict[str, Any], linkagg_data: Dict[str, Any])
     
     # Check for member ports in standby
     for lag in linkagg_data.get("lags", []):
-        standby_count = len([m for m in lag.get("members", []) if m.get("status") == "standby"])
+        standby_count = sum(1 for m in lag.get("members", []) if m.get("status") == "standby")
         if standby_count > 0:
             issues.append(
                 f"LAG {lag['agg_id']} ({lag.get('name', 'unknown')}): "
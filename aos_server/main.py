@@ -1,19 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
-from .api_models import ToolCallRequest, ToolCallResponse, ToolsListResponse, MCPMetadata
+from .api_models import ToolCallRequest, ToolCallResponse, MCPMetadata
 from .config import AppConfig, EnvSettings, DeviceDefaults, load_config
 from .inventory import InventoryStore
+from .jsonenc import dumps_bytes
 from .ssh_runner import SSHExecutionError, SSHRunner
 from .tools import call_tool, tool_infos
 from .mcp_sse import mcp_sse_endpoint
@@ -44,6 +48,25 @@ def _resolve_default_auth(defaults: Optional[DeviceDefaults]):
     return defaults.auth
 
 
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (when installed).
+
+    Returning it from an endpoint also skips FastAPI's jsonable_encoder walk,
+    which dominates the cost of large tool results such as config backups.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
+
+
+async def _reap_idle_connections(runner: SSHRunner, interval_s: float) -> None:
+    # The pool only checks idle connections when it is next used, and SSH
+    # keepalives would otherwise hold them open on a switch that is not queried again.
+    while True:
+        await asyncio.sleep(interval_s)
+        await asyncio.to_thread(runner.close_idle)
+
+
 @dataclass
 class AppState:
     env: EnvSettings
@@ -87,6 +110,20 @@ def create_app() -> FastAPI:
 
     state = AppState(env=env, cfg=cfg, inv=inv, runner=runner, zone_resolver=zone_resolver)
 
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI):
+        reaper = None
+        if cfg.ssh.pool_connections and cfg.ssh.pool_idle_timeout_s:
+            reaper = asyncio.create_task(
+                _reap_idle_connections(runner, max(1, cfg.ssh.pool_idle_timeout_s / 2))
+            )
+        try:
+            yield
+        finally:
+            if reaper is not None:
+                reaper.cancel()
+            runner.close()
+
     # Initialize rate limiter
     limiter = Limiter(key_func=get_remote_address, default_limits=[f"{env.rate_limit_per_minute}/minute"])
 
@@ -98,6 +135,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",  # Swagger UI
         redoc_url="/redoc",  # ReDoc
         openapi_url="/openapi.json",  # OpenAPI spec
+        lifespan=lifespan,
     )
 
     # Add rate limiter to app state
@@ -174,6 +212,9 @@ def create_app() -> FastAPI:
         if not x_internal_api_key or x_internal_api_key != expected:
             raise HTTPException(status_code=401, detail="Missing or invalid X-Internal-Api-Key")
 
+    # Encoded tools/list bodies per listing mode; the tool set is fixed for the app's life
+    tools_list_cache: Dict[str, bytes] = {}
+
     @app.post("/v1/tools/list", dependencies=[Depends(require_internal_api_key)])
     async def tools_list(
         request: Request,
@@ -204,13 +245,17 @@ def create_app() -> FastAPI:
         ultra_compact = body.get('ultra_compact') or query_params.get('ultra_compact') == 'true'
         compact = body.get('compact', True) if 'compact' in body else (query_params.get('compact', 'true') != 'false')
         
+        mode = "ultra_compact" if ultra_compact else "compact" if compact else "full"
+        cached = tools_list_cache.get(mode)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+        
         tools = tool_infos(st.cfg)
         
         if ultra_compact:
             # Ultra minimal: only names (for LLM discovery to avoid token explosion)
-            return {"tools": [t.name for t in tools]}
-        
-        if compact:
+            payload = {"tools": [t.name for t in tools]}
+        elif compact:
             # Return minimal version for LLMs (avoid token explosion)
             minimal_tools = [
                 {
@@ -219,9 +264,12 @@ def create_app() -> FastAPI:
                 }
                 for t in tools
             ]
-            return {"tools": minimal_tools}
+            payload = {"tools": minimal_tools}
+        else:
+            payload = {"tools": [t.model_dump() for t in tools]}
         
-        return ToolsListResponse(tools=tools).model_dump()
+        tools_list_cache[mode] = encoded = dumps_bytes(payload)
+        return Response(content=encoded, media_type="application/json")
 
     @app.post("/v1/tools/call", dependencies=[Depends(require_internal_api_key)])
     async def tools_call(req: ToolCallRequest, request: Request, st: AppState = Depends(get_state)):
@@ -231,7 +279,9 @@ def create_app() -> FastAPI:
                 raise HTTPException(status_code=400, detail="Missing authz context")
 
         try:
-            data = call_tool(
+            # Blocking SSH work runs in the threadpool, keeping the event loop free
+            data = await run_in_threadpool(
+                call_tool,
                 cfg=st.cfg,
                 inv=st.inv,
                 runner=st.runner,
@@ -244,12 +294,12 @@ def create_app() -> FastAPI:
             # Extract content blocks if provided by tool
             content_blocks = data.pop("content", None) if "content" in data else None
             
-            return ToolCallResponse(
+            return FastJSONResponse(ToolCallResponse(
                 status="ok",
                 data=data,
                 content=content_blocks,
                 meta={"tool": req.tool}
-            ).model_dump()
+            ).model_dump())
         except HTTPException:
             raise
         except KeyError as e:
@@ -6,20 +6,49 @@ Open WebUI's native MCP HTTP Streamable protocol support.
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import Any, AsyncGenerator, Dict, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
 from fastapi import HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 
 from .config import AppConfig
 from .inventory import InventoryStore
+from .jsonenc import dumps
 from .ssh_runner import SSHRunner
 from .tools import call_tool, tool_infos
 
 logger = logging.getLogger("aos_server.mcp_sse")
 
+# MCP tool descriptors, built on the first tools/list; the tool set is static.
+_mcp_tools: Optional[List[Dict[str, Any]]] = None
+
+
+def _mcp_tool_list(cfg: AppConfig) -> List[Dict[str, Any]]:
+    global _mcp_tools
+    if _mcp_tools is None:
+        _mcp_tools = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "inputSchema": tool.input_schema,
+            }
+            for tool in tool_infos(cfg)
+        ]
+    return _mcp_tools
+
+
+# Encoded tools/list result, spliced into each response envelope as-is.
+_mcp_tools_json: Optional[str] = None
+
+
+def _mcp_tools_list_json(cfg: AppConfig) -> str:
+    global _mcp_tools_json
+    if _mcp_tools_json is None:
+        _mcp_tools_json = dumps({"tools": _mcp_tool_list(cfg)})
+    return _mcp_tools_json
+
 
 class MCPSSEHandler:
     """Handler for MCP Server-Sent Events protocol."""
@@ -54,17 +83,7 @@ class MCPSSEHandler:
 
     async def handle_tools_list(self) -> Dict[str, Any]:
         """Handle MCP tools/list request."""
-        tools = tool_infos(self.cfg)
-        return {
-            "tools": [
-                {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "inputSchema": tool.input_schema,
-                }
-                for tool in tools
-            ]
-        }
+        return {"tools": _mcp_tool_list(self.cfg)}
 
     async def handle_tools_call(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle MCP tools/call request."""
@@ -96,8 +115,10 @@ class MCPSSEHandler:
         )
 
         try:
-            # Call the tool
-            data = call_tool(
+            # Tools block on SSH I/O; run them in the threadpool so the event
+            # loop keeps serving other requests (and other switches) meanwhile
+            data = await run_in_threadpool(
+                call_tool,
                 cfg=self.cfg,
                 inv=self.inv,
                 runner=self.runner,
@@ -117,7 +138,7 @@ class MCPSSEHandler:
                 content.append({"type": "text", "text": data["stdout"]})
             else:
                 # Convert data to JSON text for display
-                content.append({"type": "text", "text": json.dumps(data, indent=2)})
+                content.append({"type": "text", "text": dumps(data, indent=True)})
 
             logger.info(
                 f"Tool call success: {tool_name} | User: {subject}",
@@ -147,10 +168,16 @@ class MCPSSEHandler:
         params = request_data.get("params", {})
 
         try:
+            if method == "tools/list":
+                # Static listing: only the request id varies between responses
+                yield (
+                    f'data: {{"jsonrpc":"2.0","id":{dumps(request_data.get("id"))},'
+                    f'"result":{_mcp_tools_list_json(self.cfg)}}}\n\n'
+                )
+                return
+
             if method == "initialize":
                 result = await self.handle_initialize(params)
-            elif method == "tools/list":
-                result = await self.handle_tools_list()
             elif method == "tools/call":
                 result = await self.handle_tools_call(params)
             else:
@@ -165,7 +192,7 @@ class MCPSSEHandler:
                 "result": result,
             }
 
-            yield f"data: {json.dumps(response)}\n\n"
+            yield f"data: {dumps(response)}\n\n"
 
         except Exception as e:
             logger.exception(f"SSE stream error for method {method}")
@@ -174,7 +201,7 @@ class MCPSSEHandler:
                 "id": request_data.get("id"),
                 "error": {"code": -32603, "message": str(e)},
             }
-            yield f"data: {json.dumps(error_response)}\n\n"
+            yield f"data: {dumps(error_response)}\n\n"
 
 
 async def mcp_sse_endpoint(
@@ -246,7 +273,7 @@ async def mcp_sse_endpoint(
                 "id": None,
                 "error": {"code": -32700, "message": f"Parse error: {str(e)}"},
             }
-            yield f"data: {json.dumps(error)}\n\n"
+            yield f"data: {dumps(error)}\n\n"
 
         return StreamingResponse(
             error_stream(),
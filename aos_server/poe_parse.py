@@ -5,6 +5,17 @@ import re
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 
+# Compiled once at import; parse_show_lanpower runs them on every output line.
+# Status is one or more words ("Powered On", "Searching"), bounded to avoid backtracking.
+_PORT_LINE_RE = re.compile(
+    r'^(\d+/\d+/\d+)\s+(\d+)\s+(\d+)\s+(\S+(?:\s+\S+)*?)\s+(Low|High|Critical)\s+(ON|OFF)\s+(.?)\s*(.*?)$'
+)
+_CHASSIS_SLOT_RE = re.compile(r'ChassisId\s+(\d+)\s+Slot\s+(\d+)\s+Max Watts\s+(\d+)')
+_POWER_CONSUMED_RE = re.compile(r'(\d+)\s+Watts\s+Actual Power Consumed')
+_BUDGET_REMAINING_RE = re.compile(r'(\d+)\s+Watts\s+Actual Power Budget Remaining')
+_BUDGET_TOTAL_RE = re.compile(r'(\d+)\s+Watts\s+Total Power Budget Available')
+_POWER_SUPPLIES_RE = re.compile(r'(\d+)\s+Power Supply Available')
+
 
 @dataclass(frozen=True)
 class PoEPort:
@@ -44,10 +55,7 @@ def parse_show_lanpower(output: str) -> Dict[str, Any]:
         # Parse port lines (until we reach chassis info)
         if in_port_section and line_stripped and not line_stripped.startswith("Chassis"):
             # Flexible regex: port_id max_mw actual_mw status priority admin_state class type
-            match = re.match(
-                r'^(\d+/\d+/\d+)\s+(\d+)\s+(\d+)\s+(\S+(?:\s+\S+)*?)\s+(Low|High|Critical)\s+(ON|OFF)\s+(.?)\s*(.*?)$',
-                line_stripped
-            )
+            match = _PORT_LINE_RE.match(line_stripped)
             if match:
                 port_entry = {
                     "port_id": match.group(1),
@@ -63,29 +71,29 @@ def parse_show_lanpower(output: str) -> Dict[str, Any]:
         
         # Parse chassis summary section
         if "ChassisId" in line_stripped:
-            m = re.match(r'ChassisId\s+(\d+)\s+Slot\s+(\d+)\s+Max Watts\s+(\d+)', line_stripped)
+            m = _CHASSIS_SLOT_RE.match(line_stripped)
             if m:
                 chassis_summary["chassis_id"] = int(m.group(1))
                 chassis_summary["slot_id"] = int(m.group(2))
                 chassis_summary["max_watts"] = int(m.group(3))
         
         elif "Actual Power Consumed" in line_stripped:
-            m = re.match(r'(\d+)\s+Watts\s+Actual Power Consumed', line_stripped)
+            m = _POWER_CONSUMED_RE.match(line_stripped)
             if m:
                 chassis_summary["actual_power_consumed_watts"] = int(m.group(1))
         
         elif "Actual Power Budget Remaining" in line_stripped:
-            m = re.match(r'(\d+)\s+Watts\s+Actual Power Budget Remaining', line_stripped)
+            m = _BUDGET_REMAINING_RE.match(line_stripped)
             if m:
                 chassis_summary["power_budget_remaining_watts"] = int(m.group(1))
         
         elif "Total Power Budget Available" in line_stripped:
-            m = re.match(r'(\d+)\s+Watts\s+Total Power Budget Available', line_stripped)
+            m = _BUDGET_TOTAL_RE.match(line_stripped)
             if m:
                 chassis_summary["total_power_budget_watts"] = int(m.group(1))
         
         elif "Power Supply Available" in line_stripped:
-            m = re.match(r'(\d+)\s+Power Supply Available', line_stripped)
+            m = _POWER_SUPPLIES_RE.match(line_stripped)
             if m:
                 chassis_summary["power_supplies_available"] = int(m.group(1))
     
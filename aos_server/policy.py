@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from .config import CommandPolicyConfig
 
@@ -12,20 +13,39 @@ _ANSI_RE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
 
 @dataclass(frozen=True)
 class CompiledCommandPolicy:
-    allow: List[re.Pattern[str]]
-    deny: List[re.Pattern[str]]
+    allow: Tuple[re.Pattern[str], ...]
+    deny: Tuple[re.Pattern[str], ...]
     max_command_length: int
     deny_multiline: bool
     strip_ansi: bool
 
 
 def compile_policy(cfg: CommandPolicyConfig) -> CompiledCommandPolicy:
+    # Handlers call this on every request; the compiled policy is immutable, so
+    # it is shared for as long as the policy settings are unchanged.
+    return _compile_policy_cached(
+        tuple(cfg.allow_regex),
+        tuple(cfg.deny_regex),
+        cfg.max_command_length,
+        cfg.deny_multiline,
+        cfg.strip_ansi,
+    )
+
+
+@lru_cache(maxsize=8)
+def _compile_policy_cached(
+    allow_regex: Tuple[str, ...],
+    deny_regex: Tuple[str, ...],
+    max_command_length: int,
+    deny_multiline: bool,
+    strip_ansi: bool,
+) -> CompiledCommandPolicy:
     return CompiledCommandPolicy(
-        allow=[re.compile(p) for p in cfg.allow_regex],
-        deny=[re.compile(p) for p in cfg.deny_regex],
-        max_command_length=cfg.max_command_length,
-        deny_multiline=cfg.deny_multiline,
-        strip_ansi=cfg.strip_ansi,
+        allow=tuple(re.compile(p) for p in allow_regex),
+        deny=tuple(re.compile(p) for p in deny_regex),
+        max_command_length=max_command_length,
+        deny_multiline=deny_multiline,
+        strip_ansi=strip_ansi,
     )
 
 
@@ -33,6 +53,13 @@ def sanitize_command(command: str, policy: CompiledCommandPolicy) -> str:
     if not isinstance(command, str) or not command.strip():
         raise ValueError("Command must be a non-empty string")
 
+    return _sanitize_cached(command, policy)
+
+
+@lru_cache(maxsize=256)
+def _sanitize_cached(command: str, policy: CompiledCommandPolicy) -> str:
+    # Tools issue the same fixed commands on every call, so accepted commands
+    # are memoized per policy value. Rejections raise and are never cached.
     cmd = command.strip()
 
     if policy.deny_multiline and ("\n" in cmd or "\r" in cmd):
@@ -57,6 +84,9 @@ def sanitize_command(command: str, policy: CompiledCommandPolicy) -> str:
 
 
 def strip_ansi(text: str) -> str:
+    # Most CLI output has no escape sequences at all; skip the regex pass then.
+    if "\x1b" not in text:
+        return text
     return _ANSI_RE.sub("", text)
 
 
@@ -64,12 +94,30 @@ def apply_redactions(text: str, redactions: List[dict]) -> str:
     """Apply redaction rules to a text output.
 
     redactions: list of {pattern: <regex>, replacement: <string>}
+
+    Rules are applied in order, each to the previous rule's result, so a
+    replacement may use backreferences and later rules see earlier redactions.
     """
+    return apply_redactions_subn(text, redactions)[0]
+
+
+def apply_redactions_subn(text: str, redactions: List[dict]) -> Tuple[str, int]:
+    """Like apply_redactions, but also return the number of substitutions made."""
+    rules = tuple(
+        (rule["pattern"], rule.get("replacement", "***"))
+        for rule in redactions
+        if rule.get("pattern")
+    )
     out = text
-    for rule in redactions:
-        pattern = rule.get("pattern")
-        repl = rule.get("replacement", "***")
-        if not pattern:
-            continue
-        out = re.sub(pattern, repl, out)
-    return out
+    total = 0
+    for pattern, repl in _compile_redactions(rules):
+        out, n = pattern.subn(repl, out)
+        total += n
+    return out, total
+
+
+@lru_cache(maxsize=8)
+def _compile_redactions(
+    rules: Tuple[Tuple[str, str], ...],
+) -> Tuple[Tuple[re.Pattern[str], str], ...]:
+    return tuple((re.compile(pattern), repl) for pattern, repl in rules)
@@ -0,0 +1,64 @@
+"""Short-lived cache of read-only tool results.
+
+An LLM iterating on a problem often re-runs the same audit against the same
+switch within seconds. When cache.tool_results is enabled, tools that opt in
+with a "cacheable_ttl_s" entry in their TOOLS_INFO have their results keyed by
+(tool, validated args) and served until the TTL expires. Tools that may change
+switch state ("invalidates_cache") drop every cached entry for their host.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class ToolResultCache:
+    def __init__(self, *, max_entries: int = 256):
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        # key -> (expires_at, host, result)
+        self._entries: Dict[Tuple[str, str], Tuple[float, Optional[str], Dict[str, Any]]] = {}
+
+    @staticmethod
+    def key(tool: str, args: Dict[str, Any]) -> Tuple[str, str]:
+        return tool, json.dumps(args, sort_keys=True, default=str)
+
+    def get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Return a shallow copy of the cached result, or None if absent/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+        return dict(entry[2])
+
+    def put(self, key: Tuple[str, str], result: Dict[str, Any], ttl_s: float, host: Optional[str]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now + ttl_s, host, result)
+            if len(self._entries) > self._max_entries:
+                for k in [k for k, e in self._entries.items() if e[0] <= now]:
+                    del self._entries[k]
+                # Still full: drop the oldest insertions
+                while len(self._entries) > self._max_entries:
+                    del self._entries[next(iter(self._entries))]
+
+    def evict_expired(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for k in [k for k, e in self._entries.items() if e[0] <= now]:
+                del self._entries[k]
+
+    def invalidate_host(self, host: Optional[str]) -> None:
+        with self._lock:
+            for k in [k for k, e in self._entries.items() if e[1] == host]:
+                del self._entries[k]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
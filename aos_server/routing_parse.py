@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 import re
-from typing import Dict, List, Any
+from typing import Any, Dict, Iterable, List, Optional
+
+_VRF_ROW_RE = re.compile(r'^(\S+)\s+(\S+)\s+(.+)$')
+_ROUTES_TOTAL_RE = re.compile(r'Total\s+(\d+)\s+routes')
 
 
 def parse_show_vrf(output: str) -> List[Dict[str, Any]]:
@@ -16,7 +19,7 @@ def parse_show_vrf(output: str) -> List[Dict[str, Any]]:
             continue
             
         # Match: default              default OSPF PIM VRRP
-        match = re.match(r'^(\S+)\s+(\S+)\s+(.+)$', line)
+        match = _VRF_ROW_RE.match(line)
         if match:
             vrf_name = match.group(1)
             profile = match.group(2)
@@ -40,44 +43,22 @@ def parse_show_ip_routes(output: str, limit: int = None, protocol_filter: str =
     # Extract total
     for line in lines:
         if 'Total' in line and 'routes' in line:
-            match = re.search(r'Total\s+(\d+)\s+routes', line)
+            match = _ROUTES_TOTAL_RE.search(line)
             if match:
                 total_routes = int(match.group(1))
                 break
     
     count = 0
     for line in lines:
-        line = line.strip()
-        if not line or 'Dest Address' in line or '---' in line or '+' in line or 'Total' in line:
+        route = _parse_route_line(line)
+        if route is None:
             continue
-        
-        # Match route line: 0.0.0.0/0            10.255.9.1          36d 3h   OSPF
-        parts = line.split()
-        if len(parts) >= 3:
-            destination = parts[0]
-            gateway = parts[1]
-            if len(parts) == 3:
-                age = None
-                protocol = parts[2]
-            elif len(parts) == 4:
-                age = parts[2]
-                protocol = parts[3]
-            else:
-                age = ' '.join(parts[2:-1])
-                protocol = parts[-1]
-            
-            if protocol_filter and protocol.upper() != protocol_filter.upper():
-                continue
-                
-            routes.append({
-                'destination': destination,
-                'gateway': gateway,
-                'age': age,
-                'protocol': protocol
-            })
-            count += 1
-            if limit and count >= limit:
-                break
+        if protocol_filter and route['protocol'].upper() != protocol_filter.upper():
+            continue
+        routes.append(route)
+        count += 1
+        if limit and count >= limit:
+            break
     
     return {
         'total_routes': total_routes,
@@ -86,6 +67,71 @@ def parse_show_ip_routes(output: str, limit: int = None, protocol_filter: str =
     }
 
 
+def parse_show_ip_routes_stream(
+    lines: Iterable[str], limit: int = None, protocol_filter: str = None,
+    totals_only: bool = False,
+) -> Dict[str, Any]:
+    """Parse 'show ip routes' output from a line iterator.
+
+    Stops consuming lines once `limit` routes are collected, so a large
+    routing table is never read in full. AOS prints the 'Total N routes'
+    header before the table, so the total is still reported. With
+    totals_only, reading stops right after that header.
+    """
+    routes = []
+    total_routes = 0
+    for line in lines:
+        if 'Total' in line:
+            match = _ROUTES_TOTAL_RE.search(line)
+            if match and not total_routes:
+                total_routes = int(match.group(1))
+                if totals_only:
+                    break
+            continue
+        if totals_only:
+            continue
+        route = _parse_route_line(line)
+        if route is None:
+            continue
+        if protocol_filter and route['protocol'].upper() != protocol_filter.upper():
+            continue
+        routes.append(route)
+        if limit and len(routes) >= limit:
+            break
+    
+    return {
+        'total_routes': total_routes,
+        'routes': routes,
+        'truncated': limit and total_routes > limit
+    }
+
+
+def _parse_route_line(line: str) -> Optional[Dict[str, Any]]:
+    line = line.strip()
+    if not line or 'Dest Address' in line or '---' in line or '+' in line or 'Total' in line:
+        return None
+    
+    # Match route line: 0.0.0.0/0            10.255.9.1          36d 3h   OSPF
+    parts = line.split()
+    if len(parts) < 3:
+        return None
+    if len(parts) == 3:
+        age = None
+        protocol = parts[2]
+    elif len(parts) == 4:
+        age = parts[2]
+        protocol = parts[3]
+    else:
+        age = ' '.join(parts[2:-1])
+        protocol = parts[-1]
+    return {
+        'destination': parts[0],
+        'gateway': parts[1],
+        'age': age,
+        'protocol': protocol
+    }
+
+
 def parse_show_ip_ospf_interface(output: str) -> List[Dict[str, Any]]:
     """Parse 'show ip ospf interface' output."""
     interfaces = []
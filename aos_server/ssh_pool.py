@@ -0,0 +1,237 @@
+"""Reusable SSH connections, shared across tool calls.
+
+Opening an SSH connection to an OmniSwitch (TCP + key exchange + password auth)
+costs several hundred milliseconds, while opening another exec channel on an
+established transport is nearly free. The pool keeps authenticated connections
+per (host, port, username, jump, credential fingerprint) and lends them out;
+each borrower opens its own channels on the shared transport.
+
+OpenSSH servers cap concurrent sessions per connection (MaxSessions, 10 by
+default), so a connection is only lent while its in-flight channel count stays
+under max_channels; beyond that the pool opens an additional connection.
+
+Connections left unused for idle_timeout_s are closed (checked on acquire and
+by evict_idle() sweeps), staying ahead of the switch's own CLI inactivity timeout. When more
+than max_connections are open, the least recently used idle ones are closed.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import paramiko
+
+logger = logging.getLogger("aos_server.ssh_pool")
+
+
+@dataclass(eq=False)
+class PooledConnection:
+    client: paramiko.SSHClient
+    jump_client: Optional[paramiko.SSHClient] = None
+    in_use: int = 0  # channels currently lent out
+    uses: int = 0  # times lent out, including the first
+    last_used: float = field(default_factory=time.monotonic)
+
+    def is_active(self) -> bool:
+        transport = self.client.get_transport()
+        return transport is not None and transport.is_active()
+
+    def close(self) -> None:
+        try:
+            self.client.close()
+        finally:
+            if self.jump_client:
+                self.jump_client.close()
+
+
+class SSHConnectionPool:
+    def __init__(
+        self,
+        *,
+        max_channels: int = 8,
+        idle_timeout_s: Optional[float] = None,
+        max_connections: Optional[int] = None,
+    ):
+        self._max_channels = max_channels
+        self._idle_timeout_s = idle_timeout_s
+        self._max_connections = max_connections
+        self._lock = threading.Lock()
+        self._conns: Dict[Hashable, List[PooledConnection]] = {}
+        self._connect_locks: Dict[Hashable, threading.Lock] = {}
+
+    def acquire(
+        self,
+        key: Hashable,
+        factory: Callable[[], PooledConnection],
+        channels: int = 1,
+    ) -> Tuple[PooledConnection, bool]:
+        """Lend a live connection for key with room for `channels` more channels.
+
+        A new connection is opened with factory() when none is available.
+        Returns (connection, reused); every acquire() must be paired with a release().
+        """
+        channels = max(1, min(channels, self._max_channels))
+        self.evict_idle()
+        conn = self._lend(key, channels)
+        if conn is not None:
+            return conn, True
+
+        # One connect at a time per key, so a burst of concurrent callers fills
+        # the first new connection instead of each opening its own.
+        with self._lock:
+            connect_lock = self._connect_locks.setdefault(key, threading.Lock())
+        with connect_lock:
+            conn = self._lend(key, channels)
+            if conn is not None:
+                return conn, True
+            conn = factory()
+            conn.in_use = channels
+            conn.uses = 1
+            with self._lock:
+                self._conns.setdefault(key, []).append(conn)
+        logger.debug("ssh_pool_connect", extra={"key": str(key)})
+        self._evict_lru()
+        return conn, False
+
+    def _lend(self, key: Hashable, channels: int) -> Optional[PooledConnection]:
+        dead: List[PooledConnection] = []
+        try:
+            with self._lock:
+                conns = self._conns.get(key, [])
+                for conn in list(conns):
+                    if not conn.is_active():
+                        if conn.in_use == 0:
+                            conns.remove(conn)
+                            dead.append(conn)
+                        continue
+                    if conn.in_use + channels <= self._max_channels:
+                        conn.in_use += channels
+                        conn.uses += 1
+                        return conn
+                if dead and not conns:
+                    self._drop_key(key)
+                return None
+        finally:
+            for conn in dead:
+                conn.close()
+
+    def evict_idle(self) -> None:
+        """Close connections that have been unused for longer than idle_timeout_s."""
+        if not self._idle_timeout_s:
+            return
+        cutoff = time.monotonic() - self._idle_timeout_s
+        idle: List[PooledConnection] = []
+        with self._lock:
+            for key, conns in list(self._conns.items()):
+                for conn in list(conns):
+                    if conn.in_use == 0 and conn.last_used < cutoff:
+                        conns.remove(conn)
+                        idle.append(conn)
+                if not conns:
+                    self._drop_key(key)
+        for conn in idle:
+            logger.debug("ssh_pool_idle_close")
+            conn.close()
+
+    def _evict_lru(self) -> None:
+        if not self._max_connections:
+            return
+        evicted: List[PooledConnection] = []
+        with self._lock:
+            total = sum(len(conns) for conns in self._conns.values())
+            if total <= self._max_connections:
+                return
+            idle = sorted(
+                ((conn.last_used, key, conn)
+                 for key, conns in self._conns.items()
+                 for conn in conns if conn.in_use == 0),
+                key=lambda item: item[0],
+            )
+            for _, key, conn in idle[: total - self._max_connections]:
+                conns = self._conns[key]
+                conns.remove(conn)
+                if not conns:
+                    self._drop_key(key)
+                evicted.append(conn)
+        for conn in evicted:
+            logger.debug("ssh_pool_lru_close")
+            conn.close()
+
+    def _drop_key(self, key: Hashable) -> None:
+        """Forget a key with no connections left (caller holds self._lock)."""
+        self._conns.pop(key, None)
+        lock = self._connect_locks.get(key)
+        # A lock held by a connecting thread stays; that thread re-adds the key.
+        # Dropping one a caller is about to take at worst lets a burst open an
+        # extra connection.
+        if lock is not None and not lock.locked():
+            del self._connect_locks[key]
+
+    def release(self, conn: PooledConnection, channels: int = 1, *, discard: bool = False) -> None:
+        """Return borrowed channels; discard=True drops and closes the connection."""
+        channels = max(1, min(channels, self._max_channels))
+        with self._lock:
+            conn.in_use = max(0, conn.in_use - channels)
+            conn.last_used = time.monotonic()
+            if discard:
+                for key, conns in list(self._conns.items()):
+                    if conn in conns:
+                        conns.remove(conn)
+                        if not conns:
+                            self._drop_key(key)
+                        break
+        if discard:
+            conn.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            conns = [c for group in self._conns.values() for c in group]
+            self._conns.clear()
+            self._connect_locks.clear()
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+class HostChannelLimiter:
+    """Caps concurrent exec channels per switch, across all tool calls.
+
+    Low-end OmniSwitch CPUs struggle with many simultaneous CLI sessions; callers
+    wait here until the host has room for the channels they need.
+    """
+
+    def __init__(self, max_channels: int):
+        self._max_channels = max_channels
+        self._cond = threading.Condition()
+        self._in_use: Dict[Hashable, int] = {}
+
+    def clamp(self, channels: int) -> int:
+        return max(1, min(channels, self._max_channels))
+
+    def acquire(self, host: Hashable, channels: int = 1, timeout_s: Optional[float] = None) -> bool:
+        """Reserve channels on host; False if timeout_s passed without room."""
+        channels = self.clamp(channels)
+        with self._cond:
+            has_room = self._cond.wait_for(
+                lambda: self._in_use.get(host, 0) + channels <= self._max_channels, timeout_s
+            )
+            if not has_room:
+                return False
+            self._in_use[host] = self._in_use.get(host, 0) + channels
+            return True
+
+    def release(self, host: Hashable, channels: int = 1) -> None:
+        channels = self.clamp(channels)
+        with self._cond:
+            remaining = self._in_use.get(host, 0) - channels
+            if remaining > 0:
+                self._in_use[host] = remaining
+            else:
+                self._in_use.pop(host, None)
+            self._cond.notify_all()
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import codecs
+import hashlib
+import hmac
+import logging
 import os
 import socket
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Dict, Iterator, Optional, Sequence, Tuple
 
 import paramiko
 
@@ -18,6 +24,9 @@ from .config import (
     JumpHost,
     SSHConfig,
 )
+from .ssh_pool import HostChannelLimiter, PooledConnection, SSHConnectionPool
+
+logger = logging.getLogger("aos_server.ssh_runner")
 
 # Lock for thread-safe known_hosts file operations
 _known_hosts_lock = threading.Lock()
@@ -215,6 +224,38 @@ def _read_limited(stream, limit: int) -> tuple[str, bool]:
     return data_bytes.decode("utf-8", errors="replace"), truncated
 
 
+# Per-process key for credential fingerprints, so pool keys never carry a plain
+# (or offline-guessable) digest of a password.
+_FINGERPRINT_KEY = os.urandom(32)
+
+
+def _auth_fingerprint(auth: DeviceAuth) -> str:
+    """Keyed digest of the secret material auth resolves to.
+
+    Part of the pool key, so connections authenticated with different
+    credentials (e.g. two zones sharing a username) are never shared.
+    """
+    if isinstance(auth, (AuthPasswordEnv, AuthPasswordInline)):
+        material = _resolve_password(auth)
+    elif isinstance(auth, AuthPrivateKeyFile):
+        passphrase = os.environ.get(auth.passphrase_env, "") if auth.passphrase_env else ""
+        material = f"{auth.private_key_file}\0{passphrase}"
+    else:
+        raise RuntimeError(f"Unsupported auth type: {type(auth)}")
+    data = f"{type(auth).__name__}\0{material}".encode("utf-8")
+    return hmac.new(_FINGERPRINT_KEY, data, hashlib.sha256).hexdigest()
+
+
+# Errors that, on a reused pooled connection whose transport has since died,
+# mean the connection went stale rather than the command failing.
+_CONNECTION_ERRORS = (paramiko.SSHException, EOFError, OSError)
+
+
+def _transport_active(client: paramiko.SSHClient) -> bool:
+    transport = client.get_transport()
+    return transport is not None and transport.is_active()
+
+
 class SSHRunner:
     def __init__(
         self,
@@ -228,8 +269,42 @@ class SSHRunner:
         self._jump_hosts = jump_hosts
         self._default_device_username = default_device_username
         self._default_device_auth = default_device_auth
+        self._pool: Optional[SSHConnectionPool] = (
+            SSHConnectionPool(
+                max_channels=cfg.max_channels_per_connection,
+                idle_timeout_s=cfg.pool_idle_timeout_s,
+                max_connections=cfg.pool_max_connections,
+            )
+            if cfg.pool_connections
+            else None
+        )
+        self._host_limiter = HostChannelLimiter(cfg.max_parallel_per_host)
+
+    def close_idle(self) -> None:
+        """Close pooled connections idle for longer than pool_idle_timeout_s."""
+        if self._pool is not None:
+            self._pool.evict_idle()
+
+    def close(self) -> None:
+        """Close every pooled connection (on server shutdown)."""
+        if self._pool is not None:
+            self._pool.close_all()
+
+    def _zone_credentials(
+        self, device: Device, zone_resolver: Optional[object] = None
+    ) -> Optional[Tuple[str, str]]:
+        """Look up (username, password) for a device from the zone resolver, once.
+
+        Skipped when the device already carries both a username and auth.
+        """
+        if zone_resolver is None or (device.username and device.auth is not None):
+            return None
+        try:
+            return zone_resolver.get_primary_credentials(device.host)
+        except Exception:
+            return None
 
-    def _resolve_username(self, device: Device, zone_resolver: Optional[object] = None) -> str:
+    def _resolve_username(self, device: Device, creds: Optional[Tuple[str, str]] = None) -> str:
         """Resolve SSH username for a device.
 
         Order of precedence:
@@ -241,14 +316,9 @@ class SSHRunner:
         if device.username:
             return device.username
         
-        # Try zone resolver if available (uses global first, then zone)
-        if zone_resolver is not None:
-            try:
-                creds = zone_resolver.get_primary_credentials(device.host)
-                if creds and creds[0]:  # creds is (username, password) tuple
-                    return creds[0]
-            except Exception:
-                pass
+        # Zone resolver credentials, if available (global first, then zone)
+        if creds and creds[0]:  # creds is (username, password) tuple
+            return creds[0]
         
         username = self._default_device_username or os.environ.get("AOS_DEVICE_USERNAME")
         if not username:
@@ -258,7 +328,7 @@ class SSHRunner:
             )
         return username
 
-    def _resolve_auth(self, device: Device, zone_resolver: Optional[object] = None) -> DeviceAuth:
+    def _resolve_auth(self, device: Device, creds: Optional[Tuple[str, str]] = None) -> DeviceAuth:
         """Resolve SSH auth method for a device.
 
         Order of precedence:
@@ -270,14 +340,9 @@ class SSHRunner:
         if device.auth is not None:
             return device.auth
 
-        # Try zone resolver if available (uses global first, then zone)
-        if zone_resolver is not None:
-            try:
-                creds = zone_resolver.get_primary_credentials(device.host)
-                if creds and creds[1]:  # creds is (username, password) tuple
-                    return AuthPasswordInline(type="password_inline", password=creds[1])
-            except Exception:
-                pass
+        # Zone resolver credentials, if available (global first, then zone)
+        if creds and creds[1]:  # creds is (username, password) tuple
+            return AuthPasswordInline(type="password_inline", password=creds[1])
 
         if self._default_device_auth is not None:
             return self._default_device_auth
@@ -290,18 +355,12 @@ class SSHRunner:
             )
         return AuthPasswordEnv(type="password_env", env="AOS_DEVICE_PASSWORD")
 
-    def run(self, device: Device, command: str, timeout_s: Optional[int] = None, zone_resolver: Optional[object] = None) -> SSHResult:
-        start = time.time()
-        truncated_any = False
-        timeout = timeout_s if timeout_s is not None else self._cfg.default_command_timeout_s
-        
-        # Resolve username and password using zone_resolver if available
-        username = self._resolve_username(device, zone_resolver)
-        auth = self._resolve_auth(device, zone_resolver)
+    def _open_connection(self, device: Device, username: str, auth: DeviceAuth) -> PooledConnection:
+        """Connect and authenticate to a device (via its jump host, if any).
 
+        Pre-commands are executed once per connection.
+        """
         jump_client: Optional[paramiko.SSHClient] = None
-        client: Optional[paramiko.SSHClient] = None
-
         try:
             sock_obj = None
             if device.jump:
@@ -326,38 +385,209 @@ class SSHRunner:
                 auth,
                 sock_obj=sock_obj,
             )
+        except BaseException:
+            if jump_client:
+                jump_client.close()
+            raise
 
+        conn = PooledConnection(client=client, jump_client=jump_client)
+        try:
             # Pre-commands (e.g., disable paging)
             for pre in self._cfg.pre_commands:
                 if pre.strip():
-                    client.exec_command(pre.strip(), timeout=timeout)
+                    client.exec_command(pre.strip(), timeout=self._cfg.default_command_timeout_s)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    @contextmanager
+    def _session(
+        self,
+        device: Device,
+        zone_resolver: Optional[object] = None,
+        channels: int = 1,
+    ) -> Iterator[Tuple[paramiko.SSHClient, bool]]:
+        """Yield (client, reused) for an authenticated SSH connection to a device.
+
+        With ssh.pool_connections the client is borrowed from the connection pool
+        (room for `channels` concurrent channels) and returned afterwards; a
+        connection whose transport died is dropped. Otherwise a fresh connection
+        is opened and closed on exit. reused tells callers the connection predates
+        this call, so a dead transport means it went stale and one retry is safe.
+        """
+        # Resolve username and password, consulting zone_resolver only once
+        creds = self._zone_credentials(device, zone_resolver)
+        username = self._resolve_username(device, creds)
+        auth = self._resolve_auth(device, creds)
+
+        # Never exceed the per-host channel budget, whatever the caller asked for
+        channels = self._host_limiter.clamp(channels)
+        host_key = (device.host, device.port)
+        # Give up on a saturated switch as we would on an unreachable one
+        if not self._host_limiter.acquire(host_key, channels, timeout_s=self._cfg.connect_timeout_s):
+            raise SSHExecutionError(
+                f"Timed out waiting for a free SSH channel to {device.host}:{device.port}"
+            )
 
-            stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
+        conn: Optional[PooledConnection] = None
+        reused = False
+        try:
+            if self._pool is None:
+                conn = self._open_connection(device, username, auth)
+            else:
+                key = (device.host, device.port, username, device.jump, _auth_fingerprint(auth))
+                conn, reused = self._pool.acquire(
+                    key, lambda: self._open_connection(device, username, auth), channels
+                )
+            yield conn.client, reused
+        except _CONNECTION_ERRORS as e:
+            raise SSHExecutionError(str(e)) from e
+        finally:
+            try:
+                if conn is not None:
+                    if self._pool is None:
+                        conn.close()
+                    else:
+                        self._pool.release(conn, channels, discard=not conn.is_active())
+            finally:
+                self._host_limiter.release(host_key, channels)
 
+    def _exec(self, client: paramiko.SSHClient, command: str, timeout: int, start_ns: Optional[int] = None) -> SSHResult:
+        """Run one command on its own channel of an open connection."""
+        start_ns = start_ns if start_ns is not None else time.monotonic_ns()
+        stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
+        try:
             out, truncated_out = _read_limited(stdout, self._cfg.max_output_bytes)
             err, truncated_err = _read_limited(stderr, self._cfg.max_output_bytes)
-            truncated_any = truncated_out or truncated_err
 
             exit_status = None
             try:
                 exit_status = stdout.channel.recv_exit_status()
             except Exception:
                 exit_status = None
+        finally:
+            # The connection may be pooled: never leave a timed-out or truncated
+            # channel open on it
+            stdout.channel.close()
+
+        duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+        return SSHResult(
+            stdout=out,
+            stderr=err,
+            exit_status=exit_status,
+            duration_ms=duration_ms,
+            truncated=truncated_out or truncated_err,
+        )
+
+    def run(self, device: Device, command: str, timeout_s: Optional[int] = None, zone_resolver: Optional[object] = None) -> SSHResult:
+        start_ns = time.monotonic_ns()
+        timeout = timeout_s if timeout_s is not None else self._cfg.default_command_timeout_s
+        for attempt in range(2):
+            with self._session(device, zone_resolver) as (client, reused):
+                try:
+                    return self._exec(client, command, timeout, start_ns=start_ns)
+                except _CONNECTION_ERRORS:
+                    if attempt or not reused or _transport_active(client):
+                        raise
+            logger.info("ssh_stale_connection_retry", extra={"host": device.host})
+        raise AssertionError("unreachable")
+
+    def run_batch(
+        self,
+        device: Device,
+        commands: Sequence[str],
+        timeout_s: Optional[int] = None,
+        zone_resolver: Optional[object] = None,
+    ) -> Dict[str, SSHResult | Exception]:
+        """Run several commands over a single SSH connection.
+
+        The handshake and authentication are paid once; each command gets its own
+        exec channel on the shared transport, so outputs never need to be split.
+        Up to ssh.max_parallel_channels commands run concurrently.
+
+        Returns a dict keyed by command, in command order. A command whose channel
+        fails maps to the exception that failed it (and is logged); connection
+        failures raise SSHExecutionError.
+        """
+        timeout = timeout_s if timeout_s is not None else self._cfg.default_command_timeout_s
+        commands = list(dict.fromkeys(commands))
 
-            duration_ms = int((time.time() - start) * 1000)
-            return SSHResult(
-                stdout=out,
-                stderr=err,
-                exit_status=exit_status,
-                duration_ms=duration_ms,
-                truncated=truncated_any,
+        def exec_one(client: paramiko.SSHClient, command: str) -> SSHResult | Exception:
+            try:
+                return self._exec(client, command, timeout)
+            except _CONNECTION_ERRORS as e:
+                return e
+
+        results: Dict[str, SSHResult | Exception] = {}
+        pending = commands
+        for attempt in range(2):
+            workers = self._host_limiter.clamp(min(self._cfg.max_parallel_channels, len(pending)))
+            with self._session(device, zone_resolver, channels=workers) as (client, reused):
+                if workers > 1:
+                    with ThreadPoolExecutor(max_workers=workers) as pool:
+                        outcomes = list(pool.map(lambda c: exec_one(client, c), pending))
+                else:
+                    outcomes = [exec_one(client, c) for c in pending]
+                stale = reused and not _transport_active(client)
+
+            results.update(zip(pending, outcomes))
+            pending = [c for c, res in zip(pending, outcomes) if isinstance(res, Exception)]
+            # Retry what failed once, on a fresh connection, if a pooled one went stale
+            if not pending or not stale or attempt:
+                break
+            logger.info("ssh_stale_connection_retry", extra={"host": device.host})
+
+        for command in pending:
+            logger.warning(
+                "batch_command_failed",
+                extra={"host": device.host, "command": command, "error": repr(results[command])},
             )
-        except (paramiko.SSHException, socket.timeout, OSError) as e:
-            raise SSHExecutionError(str(e)) from e
+        return {c: results[c] for c in commands}
+
+    def stream_lines(
+        self,
+        device: Device,
+        command: str,
+        timeout_s: Optional[int] = None,
+        zone_resolver: Optional[object] = None,
+    ) -> Iterator[str]:
+        """Yield a command's stdout line by line (endings kept) as it arrives.
+
+        Output is decoded incrementally and never buffered whole; it stops at
+        max_output_bytes. Closing the generator early closes the channel
+        without draining the rest of the output.
+        """
+        timeout = timeout_s if timeout_s is not None else self._cfg.default_command_timeout_s
+        for attempt in range(2):
+            with self._session(device, zone_resolver) as (client, reused):
+                try:
+                    _, stdout, _ = client.exec_command(command, timeout=timeout)
+                except _CONNECTION_ERRORS:
+                    if attempt or not reused or _transport_active(client):
+                        raise
+                    logger.info("ssh_stale_connection_retry", extra={"host": device.host})
+                    continue
+                yield from self._stream_channel(stdout.channel)
+                return
+
+    def _stream_channel(self, channel: paramiko.Channel) -> Iterator[str]:
+        """Yield decoded lines from an exec channel, closing it when done."""
+        try:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            remaining = self._cfg.max_output_bytes
+            pending = ""
+            while remaining > 0:
+                chunk = channel.recv(min(32768, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                lines = (pending + decoder.decode(chunk)).splitlines(keepends=True)
+                pending = lines.pop() if lines and not lines[-1].endswith(("\n", "\r")) else ""
+                yield from lines
+            pending += decoder.decode(b"", final=True)
+            if pending:
+                yield pending
         finally:
-            try:
-                if client:
-                    client.close()
-            finally:
-                if jump_client:
-                    jump_client.close()
+            # The connection may be pooled: never leave a half-read channel open
+            channel.close()
@@ -12,11 +12,15 @@ Categories:
 - system: System management (aos.config.backup, health.monitor, chassis.status)
 """
 
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Type
+
+from pydantic import BaseModel
 
 from ..api_models import RequestContext, ToolInfo
 from ..config import AppConfig
 from ..inventory import InventoryStore
+from ..result_cache import ToolResultCache
 from ..ssh_runner import SSHRunner
 
 # Import handlers from submodules
@@ -61,8 +65,8 @@ from .system import (
 # TOOL REGISTRY
 # =============================================================================
 
-# Map tool names to handlers
-TOOL_HANDLERS = {
+# Map tool names to handlers (read-only; the tool set is fixed at import)
+TOOL_HANDLERS: Mapping[str, Callable[..., Dict[str, Any]]] = MappingProxyType({
     # CLI
     "aos.cli.readonly": handle_cli_readonly,
     # Diagnostics
@@ -89,7 +93,7 @@ TOOL_HANDLERS = {
     "aos.config.backup": handle_config_backup,
     "aos.health.monitor": handle_health_monitor,
     "aos.chassis.status": handle_chassis_status,
-}
+})
 
 # Collect all tool info
 ALL_TOOLS_INFO = (
@@ -101,6 +105,41 @@ ALL_TOOLS_INFO = (
     + SYSTEM_TOOLS_INFO
 )
 
+# ToolInfo models are built once at import; tools/list is hit on every client
+# (re)connect and the schemas never change at runtime. The descriptors are
+# in-tree literals, so validation is skipped.
+_TOOL_INFOS: List[ToolInfo] = sorted(
+    (
+        ToolInfo.model_construct(
+            name=info["name"],
+            description=info["description"],
+            input_schema=info["input_schema"],
+            output_schema=info.get("output_schema", {}),
+            required_scopes=info.get("required_scopes", []),
+        )
+        for info in ALL_TOOLS_INFO
+    ),
+    key=lambda t: t.name,
+)
+
+# Read-only tools opt into short-lived result caching (cache.tool_results) via
+# "cacheable_ttl_s" and name their "args_model", so equivalent arguments share an
+# entry; tools that may change switch state ("invalidates_cache") flush their host.
+_CACHE_TTL_S: Dict[str, float] = {
+    info["name"]: info["cacheable_ttl_s"]
+    for info in ALL_TOOLS_INFO
+    if info.get("cacheable_ttl_s")
+}
+_CACHE_ARGS_MODELS: Dict[str, Type[BaseModel]] = {
+    info["name"]: info["args_model"]
+    for info in ALL_TOOLS_INFO
+    if info.get("cacheable_ttl_s")
+}
+_CACHE_INVALIDATING_TOOLS = frozenset(
+    info["name"] for info in ALL_TOOLS_INFO if info.get("invalidates_cache")
+)
+_RESULT_CACHE = ToolResultCache()
+
 
 # =============================================================================
 # PUBLIC API
@@ -134,11 +173,30 @@ def call_tool(
         ValueError: If arguments invalid
         PermissionError: If not authorized
     """
-    if tool not in TOOL_HANDLERS:
+    handler = TOOL_HANDLERS.get(tool)
+    if handler is None:
         raise KeyError(f"Unknown tool: {tool}")
-    
-    handler = TOOL_HANDLERS[tool]
-    return handler(cfg, runner, args, zone_resolver)
+
+    ttl_s = _CACHE_TTL_S.get(tool) if cfg.cache.tool_results else None
+    if not ttl_s:
+        try:
+            return handler(cfg, runner, args, zone_resolver)
+        finally:
+            # Even a failed call may have changed the switch part-way
+            if tool in _CACHE_INVALIDATING_TOOLS:
+                _RESULT_CACHE.invalidate_host(args.get("host"))
+
+    # Key on the validated arguments, defaults filled in
+    parsed = _CACHE_ARGS_MODELS[tool].model_validate(args)
+    key = _RESULT_CACHE.key(tool, parsed.model_dump(mode="json"))
+    cached = _RESULT_CACHE.get(key)
+    if cached is not None:
+        cached["cached"] = True
+        return cached
+    result = handler(cfg, runner, args, zone_resolver)
+    _RESULT_CACHE.put(key, result, ttl_s, parsed.host)
+    # Callers may pop keys (e.g. "content"); keep the cached dict intact
+    return dict(result)
 
 
 def tool_infos(cfg: Optional[AppConfig] = None) -> List[ToolInfo]:
@@ -148,19 +206,9 @@ def tool_infos(cfg: Optional[AppConfig] = None) -> List[ToolInfo]:
         cfg: Optional config for filtering tools
         
     Returns:
-        List of ToolInfo objects
+        Shared list of ToolInfo objects (treat as read-only)
     """
-    tools = [
-        ToolInfo(
-            name=info["name"],
-            description=info["description"],
-            input_schema=info["input_schema"],
-            output_schema=info.get("output_schema", {}),
-            required_scopes=info.get("required_scopes", []),
-        )
-        for info in ALL_TOOLS_INFO
-    ]
-    return sorted(tools, key=lambda t: t.name)
+    return _TOOL_INFOS
 
 
 # =============================================================================
@@ -4,16 +4,22 @@ Tools: aos.vlan.audit, aos.routing.audit, aos.spantree.audit
 """
 
 import time
-from typing import Any, Dict, List, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field
 
-from .base import create_device_from_host
-from ..policy import compile_policy, sanitize_command
+from .base import (
+    CONTENT_MODE_SCHEMA, ContentMode, create_device_from_host, run_commands, text_content,
+)
 from ..config import AppConfig
+from ..policy import compile_policy, sanitize_command
 from ..ssh_runner import SSHRunner
 from ..vlan_parse import parse_show_vlan, parse_show_vlan_detail, analyze_vlan_config
 from ..routing_parse import (
-    parse_show_vrf, parse_show_ip_routes, parse_show_ip_ospf_interface,
+    parse_show_vrf, parse_show_ip_routes_stream, parse_show_ip_ospf_interface,
     parse_show_ip_ospf_neighbor, parse_show_ip_interface
 )
 from ..stp_parse import (
@@ -29,24 +35,63 @@ from ..stp_parse import (
 class ArgsVlanAudit(BaseModel):
     host: str = Field(description="Target switch IP address")
     vlan_id: Optional[int] = Field(default=None, description="Specific VLAN to audit")
-    port: Optional[int] = Field(default=22)
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
+    content: ContentMode = Field(default="full", description="Text output: full, summary or structured")
 
 
 class ArgsRoutingAudit(BaseModel):
     host: str = Field(description="Target switch IP address")
     vrf: Optional[str] = Field(default=None, description="Specific VRF to audit")
-    port: Optional[int] = Field(default=22)
+    include_routes: bool = Field(default=True, description="Return route entries, not just the total")
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
+    content: ContentMode = Field(default="full", description="Text output: full, summary or structured")
 
 
 class ArgsSpantreeAudit(BaseModel):
     host: str = Field(description="Target switch IP address")
-    port: Optional[int] = Field(default=22)
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
+    content: ContentMode = Field(default="full", description="Text output: full, summary or structured")
 
 
 # =============================================================================
 # HANDLERS
 # =============================================================================
 
+# Large chassis can yield hundreds of issues; the full count is always reported
+# as issues_count, but only the first ones are formatted and returned (the rest
+# are counted in issues_truncated) to keep payloads bounded.
+MAX_ISSUES_RETURNED = 50
+
+# Spanning tree issues are detected as (code, port_id, state) tuples and only
+# formatted for the ones actually returned. Codes are stable for machine use.
+STP_ISSUE_FORMATS = {
+    "STP_DISABLED": "Spanning Tree is DISABLED - potential loop risk",
+    "PORT_UNUSUAL_STATE": "Port {port_id} in unusual state: {state}",
+    "ROOT_PORT_NOT_FORWARDING": "Root port {port_id} is not forwarding",
+}
+
+# STP roles for which a blocked port is normal (redundant paths)
+STP_STANDBY_ROLES = frozenset({"ALT", "BKUP"})
+
+# OSPF adjacency states that are not reported as issues
+OSPF_OK_STATES = frozenset({"full", "two-way"})
+
+
+def _format_issues(issues: List[str], limit: int = 5, total: Optional[int] = None) -> str:
+    """Render the issues section of an audit summary ('' when there are none).
+
+    total overrides len(issues) when only a prefix of the issues is passed in.
+    """
+    total = len(issues) if total is None else total
+    if not total:
+        return ""
+    lines = [f"\n\n⚠️ Issues ({total}):"]
+    lines.extend(f"- {i}" for i in islice(issues, limit))
+    if total > limit:
+        lines.append(f"... and {total - limit} more")
+    return "\n".join(lines)
+
+
 def handle_vlan_audit(
     cfg: AppConfig,
     runner: SSHRunner,
@@ -55,11 +100,10 @@ def handle_vlan_audit(
 ) -> Dict[str, Any]:
     """Audit VLAN configuration."""
     parsed = ArgsVlanAudit.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     compiled_policy = compile_policy(cfg.command_policy)
     
-    start_time = time.time()
-    commands_executed = []
+    start_ns = time.monotonic_ns()
     
     # Run commands
     if parsed.vlan_id:
@@ -67,12 +111,10 @@ def handle_vlan_audit(
     else:
         commands = ["show vlan"]
     
-    results = {}
-    for cmd in commands:
-        safe_cmd = sanitize_command(cmd, compiled_policy)
-        res = runner.run(device, safe_cmd, timeout_s=15, zone_resolver=zone_resolver)
-        results[cmd] = res.stdout
-        commands_executed.append(cmd)
+    results, commands_executed = run_commands(
+        runner, device, commands, compiled_policy,
+        timeout_s=15, zone_resolver=zone_resolver, best_effort=False,
+    )
     
     # Parse VLANs
     vlans = parse_show_vlan(results.get("show vlan", ""))
@@ -82,28 +124,31 @@ def handle_vlan_audit(
         vlans = [v for v in vlans if v['vlan_id'] == parsed.vlan_id]
     
     # Analyze
-    summary, issues = analyze_vlan_config(vlans)
-    duration_ms = int((time.time() - start_time) * 1000)
+    summary, issues = analyze_vlan_config(vlans, max_issues=MAX_ISSUES_RETURNED)
+    issues_count = summary.pop('issues_total')
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
     # Build content
-    if parsed.vlan_id and vlans:
-        v = vlans[0]
-        content_text = (
-            f"**VLAN {v['vlan_id']}: {v.get('name', 'N/A')}**\n\n"
-            f"Type: {v.get('type', 'N/A')}\n"
-            f"Admin: {v.get('admin_state', 'N/A')} | Oper: {v.get('oper_state', 'N/A')}\n"
-            f"MTU: {v.get('mtu', 1500)}"
-        )
-    else:
-        content_text = (
-            f"**VLAN Audit: {device.host}**\n\n"
-            f"Total VLANs: {summary['total']}\n"
-            f"Enabled: {summary['enabled']} | Disabled: {summary['disabled']}\n"
-            f"Operational: {summary['operational']}"
-        )
-    
-    if issues:
-        content_text += f"\n\n⚠️ Issues ({len(issues)}):\n" + "\n".join(f"- {i}" for i in issues[:5])
+    content_text = ""
+    if parsed.content != "structured":
+        if parsed.vlan_id and vlans:
+            v = vlans[0]
+            parts = [
+                f"**VLAN {v['vlan_id']}: {v.get('name', 'N/A')}**\n\n"
+                f"Type: {v.get('type', 'N/A')}\n"
+                f"Admin: {v.get('admin_state', 'N/A')} | Oper: {v.get('oper_state', 'N/A')}\n"
+                f"MTU: {v.get('mtu', 1500)}"
+            ]
+        else:
+            parts = [
+                f"**VLAN Audit: {device.host}**\n\n"
+                f"Total VLANs: {summary['total']}\n"
+                f"Enabled: {summary['enabled']} | Disabled: {summary['disabled']}\n"
+                f"Operational: {summary['operational']}"
+            ]
+        if parsed.content == "full":
+            parts.append(_format_issues(issues, total=issues_count))
+        content_text = "".join(parts)
     
     return {
         "host": device.host,
@@ -111,9 +156,11 @@ def handle_vlan_audit(
         "vlans": vlans,
         "summary": summary,
         "issues": issues,
+        "issues_count": issues_count,
+        "issues_truncated": issues_count - len(issues),
         "duration_ms": duration_ms,
         "commands_executed": commands_executed,
-        "content": [{"type": "text", "text": content_text}]
+        "content": text_content(content_text, parsed.content)
     }
 
 
@@ -125,73 +172,80 @@ def handle_routing_audit(
 ) -> Dict[str, Any]:
     """Audit routing configuration (VRFs, OSPF, static routes)."""
     parsed = ArgsRoutingAudit.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     compiled_policy = compile_policy(cfg.command_policy)
     
-    start_time = time.time()
-    commands_executed = []
+    start_ns = time.monotonic_ns()
     
-    # Commands to run
+    # Commands to run ("show vrf" only makes sense outside a VRF context)
+    prefix = f"vrf {parsed.vrf} " if parsed.vrf else ""
+    vrf_cmd = None if parsed.vrf else "show vrf"
+    route_cmd = f"{prefix}show ip routes"
+    neighbor_cmd = f"{prefix}show ip ospf neighbor"
     commands = [
-        "show vrf",
-        "show ip routes",
-        "show ip ospf interface",
-        "show ip ospf neighbor",
+        f"{prefix}show ip ospf interface",
+        neighbor_cmd,
     ]
-    
-    if parsed.vrf:
-        commands = [
-            f"vrf {parsed.vrf} show ip routes",
-            f"vrf {parsed.vrf} show ip ospf interface",
-            f"vrf {parsed.vrf} show ip ospf neighbor",
-        ]
-    
-    results = {}
-    for cmd in commands:
-        safe_cmd = sanitize_command(cmd, compiled_policy)
+    if vrf_cmd:
+        commands.insert(0, vrf_cmd)
+    
+    safe_route_cmd = sanitize_command(route_cmd, compiled_policy)
+    
+    # Routing tables can be huge: parse them as they stream in and stop
+    # reading once enough routes are collected for the LLM.
+    def stream_routes() -> Dict[str, Any]:
+        with closing(runner.stream_lines(
+            device, safe_route_cmd, timeout_s=15, zone_resolver=zone_resolver
+        )) as lines:
+            return parse_show_ip_routes_stream(
+                lines, limit=100, totals_only=not parsed.include_routes
+            )
+    
+    # The route stream runs alongside the batched commands on the same pool
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        route_future = executor.submit(stream_routes)
+        results, commands_executed = run_commands(
+            runner, device, commands, compiled_policy, timeout_s=15, zone_resolver=zone_resolver
+        )
         try:
-            res = runner.run(device, safe_cmd, timeout_s=15, zone_resolver=zone_resolver)
-            results[cmd] = res.stdout
-            commands_executed.append(cmd)
+            route_data = route_future.result()
         except Exception:
-            pass
+            route_data = None
     
     # Parse results
-    vrfs = []
-    if "show vrf" in results:
-        vrfs = parse_show_vrf(results["show vrf"])
-    
     routes = []
     route_total = 0
-    for cmd, output in results.items():
-        if "routes" in cmd:
-            route_data = parse_show_ip_routes(output, limit=100)  # Limit for LLM
-            routes.extend(route_data.get("routes", []))
-            route_total += route_data.get("total_routes", 0)
+    if route_data is not None:
+        routes = route_data["routes"]
+        route_total = route_data["total_routes"]
+        commands_executed.insert(1 if vrf_cmd in commands_executed else 0, route_cmd)
     
-    ospf_neighbors = []
-    for cmd, output in results.items():
-        if "ospf neighbor" in cmd:
-            ospf_neighbors.extend(parse_show_ip_ospf_neighbor(output))
+    vrfs = parse_show_vrf(results[vrf_cmd]) if vrf_cmd in results else []
+    ospf_neighbors = parse_show_ip_ospf_neighbor(results.get(neighbor_cmd, ""))
     
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
     # Detect issues
-    issues = []
-    for neighbor in ospf_neighbors:
-        if neighbor.get('state', '').lower() not in ['full', 'two-way']:
-            issues.append(f"OSPF neighbor {neighbor.get('neighbor_id')} in state {neighbor.get('state')}")
-    
-    routes_shown = len(routes)
-    content_text = (
-        f"**Routing Audit: {device.host}**\n\n"
-        f"VRFs: {len(vrfs)}\n"
-        f"Routes: {route_total} total ({routes_shown} shown)\n"
-        f"OSPF Neighbors: {len(ospf_neighbors)}"
-    )
+    bad_neighbors = [
+        neighbor for neighbor in ospf_neighbors
+        if neighbor.get('state', '').lower() not in OSPF_OK_STATES
+    ]
+    issues = [
+        f"OSPF neighbor {neighbor.get('neighbor_id')} in state {neighbor.get('state')}"
+        for neighbor in bad_neighbors[:MAX_ISSUES_RETURNED]
+    ]
     
-    if issues:
-        content_text += f"\n\n⚠️ Issues ({len(issues)}):\n" + "\n".join(f"- {i}" for i in issues[:5])
+    content_text = ""
+    if parsed.content != "structured":
+        parts = [
+            f"**Routing Audit: {device.host}**\n\n"
+            f"VRFs: {len(vrfs)}\n"
+            f"Routes: {route_total} total ({len(routes)} shown)\n"
+            f"OSPF Neighbors: {len(ospf_neighbors)}"
+        ]
+        if parsed.content == "full":
+            parts.append(_format_issues(issues, total=len(bad_neighbors)))
+        content_text = "".join(parts)
     
     return {
         "host": device.host,
@@ -200,9 +254,11 @@ def handle_routing_audit(
         "route_total": route_total,
         "ospf_neighbors": ospf_neighbors,
         "issues": issues,
+        "issues_count": len(bad_neighbors),
+        "issues_truncated": len(bad_neighbors) - len(issues),
         "duration_ms": duration_ms,
         "commands_executed": commands_executed,
-        "content": [{"type": "text", "text": content_text}]
+        "content": text_content(content_text, parsed.content)
     }
 
 
@@ -214,11 +270,10 @@ def handle_spantree_audit(
 ) -> Dict[str, Any]:
     """Audit Spanning Tree configuration."""
     parsed = ArgsSpantreeAudit.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     compiled_policy = compile_policy(cfg.command_policy)
     
-    start_time = time.time()
-    commands_executed = []
+    start_ns = time.monotonic_ns()
     
     commands = [
         "show spantree mode",
@@ -226,56 +281,77 @@ def handle_spantree_audit(
         "show spantree cist ports",
     ]
     
-    results = {}
-    for cmd in commands:
-        safe_cmd = sanitize_command(cmd, compiled_policy)
-        try:
-            res = runner.run(device, safe_cmd, timeout_s=15, zone_resolver=zone_resolver)
-            results[cmd] = res.stdout
-            commands_executed.append(cmd)
-        except Exception:
-            pass
+    results, commands_executed = run_commands(
+        runner, device, commands, compiled_policy, timeout_s=15, zone_resolver=zone_resolver
+    )
     
     # Parse results
     mode = parse_show_spantree_mode(results.get("show spantree mode", ""))
     cist = parse_show_spantree_cist(results.get("show spantree cist", ""))
     ports = parse_show_spantree_ports(results.get("show spantree cist ports", ""))
     
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
     # Detect issues
-    issues = []
+    found: List[Tuple[str, Optional[str], Optional[str]]] = []
     if mode.get('status', '').lower() == 'disabled':
-        issues.append("Spanning Tree is DISABLED - potential loop risk")
+        found.append(("STP_DISABLED", None, None))
     
+    # State counts are tallied in C by Counter; only non-forwarding ports
+    # need a Python-level look for issue detection.
+    port_states = Counter(port['oper_status'] for port in ports)
+    forwarding_ports = port_states['FORW']
+    blocking_ports = len(ports) - forwarding_ports - port_states['DIS']
     for port in ports:
-        state = port.get('state', '').lower()
-        if state in ['blocking', 'listening', 'learning']:
-            issues.append(f"Port {port.get('port')} in {state} state")
-    
-    content_text = (
-        f"**Spanning Tree Audit: {device.host}**\n\n"
-        f"Mode: {mode.get('mode', 'N/A')}\n"
-        f"Status: {cist.get('stp_status', 'N/A')}\n"
-        f"Ports monitored: {len(ports)}"
-    )
-    
-    if cist.get('designated_root') or cist.get('cst_designated_root'):
-        root = cist.get('designated_root') or cist.get('cst_designated_root')
-        content_text += f"\nRoot Bridge: {root}"
+        status = port['oper_status']
+        if status == 'FORW':
+            continue
+        port_id = port['port_id']
+        role = port['role']
+        if role == 'ROOT':
+            found.append(("ROOT_PORT_NOT_FORWARDING", port_id, status))
+        elif status != 'DIS' and role not in STP_STANDBY_ROLES:
+            found.append(("PORT_UNUSUAL_STATE", port_id, status))
+    
+    issues = [
+        STP_ISSUE_FORMATS[code].format(port_id=port_id, state=state)
+        for code, port_id, state in found[:MAX_ISSUES_RETURNED]
+    ]
     
-    if issues:
-        content_text += f"\n\n⚠️ Issues ({len(issues)}):\n" + "\n".join(f"- {i}" for i in issues[:5])
+    root = cist.get('designated_root') or cist.get('cst_designated_root')
+    is_root_bridge = bool(root) and root == cist.get('bridge_id')
+    
+    content_text = ""
+    if parsed.content != "structured":
+        parts = [
+            f"**Spanning Tree Audit: {device.host}**\n\n"
+            f"Mode: {mode.get('mode', 'N/A')}\n"
+            f"Status: {cist.get('stp_status', 'N/A')}\n"
+            f"Ports monitored: {len(ports)} "
+            f"(forwarding: {forwarding_ports}, non-forwarding: {blocking_ports})"
+        ]
+        if root:
+            parts.append(f"\nRoot Bridge: {root}" + (" (this switch)" if is_root_bridge else ""))
+        if parsed.content == "full":
+            parts.append(_format_issues(issues, total=len(found)))
+        content_text = "".join(parts)
     
     return {
         "host": device.host,
         "mode": mode,
         "cist": cist,
         "ports": ports,
+        "is_root_bridge": is_root_bridge,
+        "port_states": dict(port_states),
+        "forwarding_ports": forwarding_ports,
+        "blocking_ports": blocking_ports,
         "issues": issues,
+        "issues_count": len(found),
+        "issues_truncated": len(found) - len(issues),
+        "issue_counts": dict(Counter(code for code, _, _ in found)),
         "duration_ms": duration_ms,
         "commands_executed": commands_executed,
-        "content": [{"type": "text", "text": content_text}]
+        "content": text_content(content_text, parsed.content)
     }
 
 
@@ -295,10 +371,13 @@ TOOLS_INFO = [
             "properties": {
                 "host": {"type": "string", "description": "Switch IP address"},
                 "vlan_id": {"type": "integer", "description": "Specific VLAN to audit (optional)"},
+                "content": CONTENT_MODE_SCHEMA,
             },
             "required": ["host"]
         },
-        "output_schema": {"type": "object"}
+        "output_schema": {"type": "object"},
+        "cacheable_ttl_s": 10,
+        "args_model": ArgsVlanAudit,
     },
     {
         "name": "aos.routing.audit",
@@ -311,10 +390,18 @@ TOOLS_INFO = [
             "properties": {
                 "host": {"type": "string", "description": "Switch IP address"},
                 "vrf": {"type": "string", "description": "Specific VRF to audit (optional)"},
+                "include_routes": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Return route entries; false returns only route_total (faster on large tables)"
+                },
+                "content": CONTENT_MODE_SCHEMA,
             },
             "required": ["host"]
         },
-        "output_schema": {"type": "object"}
+        "output_schema": {"type": "object"},
+        "cacheable_ttl_s": 10,
+        "args_model": ArgsRoutingAudit,
     },
     {
         "name": "aos.spantree.audit",
@@ -326,9 +413,12 @@ TOOLS_INFO = [
             "type": "object",
             "properties": {
                 "host": {"type": "string", "description": "Switch IP address"},
+                "content": CONTENT_MODE_SCHEMA,
             },
             "required": ["host"]
         },
-        "output_schema": {"type": "object"}
+        "output_schema": {"type": "object"},
+        "cacheable_ttl_s": 10,
+        "args_model": ArgsSpantreeAudit,
     },
 ]
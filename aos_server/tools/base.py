@@ -8,62 +8,138 @@ from __future__ import annotations
 
 import re
 import string
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, TypedDict
 
 from pydantic import BaseModel, Field
 
-from ..config import Device, AuthPasswordInline
+from ..config import AppConfig, Device, AuthPasswordInline
+from ..policy import CompiledCommandPolicy, sanitize_command
+from ..ssh_runner import SSHExecutionError, SSHResult, SSHRunner
 
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+@lru_cache(maxsize=256)
 def create_device_from_host(
     host: str,
-    port: int = 22,
+    port: Optional[int] = 22,
     username: Optional[str] = None
 ) -> Device:
-    """Create a Device object from host parameters."""
+    """Create a Device object from host parameters.
+
+    An explicit None port (JSON null in tool args) means the default SSH port.
+    Instances are cached per (host, port, username) and shared between calls,
+    so callers must not modify them.
+    """
     auth = AuthPasswordInline(password="") if username else None
     return Device(
         id=f"dynamic-{host}",
         host=host,
-        port=port,
+        port=22 if port is None else port,
         username=username,
         auth=auth,
     )
 
 
+def run_commands(
+    runner: SSHRunner,
+    device: Device,
+    commands: List[str],
+    compiled_policy: CompiledCommandPolicy,
+    *,
+    timeout_s: Optional[int] = None,
+    zone_resolver: Any = None,
+    best_effort: bool = True,
+    required: Sequence[str] = (),
+) -> Tuple[Dict[str, str], List[str]]:
+    """Sanitize and run several commands over a single SSH connection.
+
+    Returns (stdout by command, commands that succeeded), in command order.
+    With best_effort, failed commands (or an unreachable device) are simply
+    missing from the results, except for those listed in required; otherwise
+    any failure raises SSHExecutionError. Policy violations always raise
+    ValueError before anything is run.
+    """
+    safe_cmds = {cmd: sanitize_command(cmd, compiled_policy) for cmd in commands}
+    must_succeed = set(required) if best_effort else set(commands)
+    try:
+        batch = runner.run_batch(
+            device, list(safe_cmds.values()), timeout_s=timeout_s, zone_resolver=zone_resolver
+        )
+    except Exception:
+        if must_succeed:
+            raise
+        batch = {}
+
+    results: Dict[str, str] = {}
+    for cmd, safe_cmd in safe_cmds.items():
+        res = batch.get(safe_cmd)
+        if isinstance(res, SSHResult):
+            results[cmd] = res.stdout
+        elif cmd in must_succeed:
+            if isinstance(res, Exception):
+                raise SSHExecutionError(f"Command failed: {safe_cmd}: {res}") from res
+            raise SSHExecutionError(f"Command failed: {safe_cmd}")
+    return results, list(results)
+
+
+class _SafeFormatter(string.Formatter):
+    """Formatter that leaves unknown named placeholders untouched."""
+
+    def get_value(self, key, args, kwargs):
+        if isinstance(key, str):
+            return kwargs.get(key, f"{{{key}}}")
+        return super().get_value(key, args, kwargs)
+
+
+# Stateless, so one instance is shared by all callers
+_SAFE_FORMATTER = _SafeFormatter()
+_NUM_RE = re.compile(r'\d+')
+
+
 def format_template(template: str, args: Dict[str, Any]) -> str:
     """Format a command template with arguments.
     
     Only replaces placeholders that exist in args.
     """
-    class SafeFormatter(string.Formatter):
-        def get_value(self, key, args, kwargs):
-            if isinstance(key, str):
-                return kwargs.get(key, f"{{{key}}}")
-            return super().get_value(key, args, kwargs)
-    
-    formatter = SafeFormatter()
-    return formatter.format(template, **args)
+    return _SAFE_FORMATTER.format(template, **args)
 
 
 def extract_numeric(text: str) -> Optional[int]:
     """Extract first numeric value from text."""
-    match = re.search(r'\d+', text)
+    match = _NUM_RE.search(text)
     return int(match.group()) if match else None
 
 
+def text_content(text: str, mode: ContentMode = "full") -> List[Dict[str, Any]]:
+    """Wrap a tool's text summary as MCP content blocks ([] in structured mode)."""
+    if mode == "structured":
+        return []
+    return [{"type": "text", "text": text}]
+
+
 # =============================================================================
 # COMMON ARGUMENT MODELS
 # =============================================================================
 
+# How much human-readable text a tool returns next to its structured fields:
+# full text, a short summary, or none at all for programmatic callers.
+ContentMode = Literal["full", "summary", "structured"]
+
+CONTENT_MODE_SCHEMA = {
+    "type": "string",
+    "enum": ["full", "summary", "structured"],
+    "default": "full",
+    "description": "Text output: full, summary (no detail sections), or structured (data fields only)",
+}
+
 class ArgsHost(BaseModel):
     """Base arguments with just host."""
     host: str = Field(description="Target switch IP address or hostname")
-    port: Optional[int] = Field(default=22, description="SSH port")
+    port: Optional[int] = Field(default=22, ge=1, le=65535, description="SSH port")
 
 
 class ArgsHostCommand(ArgsHost):
@@ -183,20 +259,20 @@ class InterfaceInfo(BaseModel):
 # DEVICE FACTS MODELS
 # =============================================================================
 
-class DeviceFacts(BaseModel):
-    """Structured device facts from OmniSwitch."""
-    system_name: Optional[str] = None
-    system_description: Optional[str] = None
-    model: Optional[str] = None
-    serial_number: Optional[str] = None
-    software_version: Optional[str] = None
-    hardware_revision: Optional[str] = None
-    base_mac: Optional[str] = None
-    uptime: Optional[str] = None
-    contact: Optional[str] = None
-    location: Optional[str] = None
-    hardware: Optional[Dict[str, Any]] = None
-    lldp: Optional[Dict[str, Any]] = None
+class DeviceFacts(TypedDict):
+    """Structured device facts from OmniSwitch (the "facts" result field)."""
+    system_name: Optional[str]
+    system_description: Optional[str]
+    model: Optional[str]
+    serial_number: Optional[str]
+    software_version: Optional[str]
+    hardware_revision: Optional[str]
+    base_mac: Optional[str]
+    uptime: Optional[str]
+    contact: Optional[str]
+    location: Optional[str]
+    hardware: Optional[Dict[str, Any]]
+    lldp: Optional[Dict[str, Any]]
 
 
 # =============================================================================
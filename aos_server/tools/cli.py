@@ -7,7 +7,7 @@ from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field
 
 from .base import create_device_from_host
-from ..policy import apply_redactions, compile_policy, sanitize_command, strip_ansi
+from ..policy import apply_redactions_subn, compile_policy, sanitize_command, strip_ansi
 from ..config import AppConfig
 from ..ssh_runner import SSHRunner
 
@@ -20,7 +20,7 @@ class ArgsCliReadonly(BaseModel):
     """Arguments for CLI readonly tool."""
     host: str = Field(description="Target switch IP address or hostname")
     command: str = Field(description="Read-only command to execute")
-    port: Optional[int] = Field(default=22, description="SSH port")
+    port: Optional[int] = Field(default=22, ge=1, le=65535, description="SSH port")
     username: Optional[str] = Field(default=None, description="SSH username")
     timeout_s: Optional[int] = Field(default=None, description="Command timeout")
 
@@ -52,7 +52,7 @@ def handle_cli_readonly(
     Returns the command output with optional redaction of sensitive data.
     """
     parsed = ArgsCliReadonly.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22, parsed.username)
+    device = create_device_from_host(parsed.host, parsed.port, parsed.username)
     
     compiled_policy = compile_policy(cfg.command_policy)
     cmd = sanitize_command(parsed.command, compiled_policy)
@@ -69,10 +69,9 @@ def handle_cli_readonly(
     
     # Apply redactions if configured
     if cfg.command_policy.redactions:
-        stdout2 = apply_redactions(stdout, cfg.command_policy.redactions)
-        stderr2 = apply_redactions(stderr, cfg.command_policy.redactions)
-        redacted = (stdout2 != stdout) or (stderr2 != stderr)
-        stdout, stderr = stdout2, stderr2
+        stdout, n_out = apply_redactions_subn(stdout, cfg.command_policy.redactions)
+        stderr, n_err = apply_redactions_subn(stderr, cfg.command_policy.redactions)
+        redacted = (n_out + n_err) > 0
     
     return {
         "host": device.host,
@@ -134,5 +133,7 @@ TOOL_INFO = {
             "duration_ms": {"type": "number"},
             "redacted": {"type": "boolean", "description": "Whether sensitive data was redacted"}
         }
-    }
+    },
+    # The command policy decides what may run; it need not be read-only
+    "invalidates_cache": True,
 }
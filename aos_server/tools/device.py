@@ -8,7 +8,9 @@ import time
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
-from .base import create_device_from_host, DeviceFacts, InterfaceInfo
+from .base import (
+    create_device_from_host, run_commands, DeviceFacts, InterfaceInfo
+)
 from ..policy import compile_policy, sanitize_command
 from ..config import AppConfig
 from ..ssh_runner import SSHRunner
@@ -21,25 +23,25 @@ from ..interface_parse import parse_interfaces_status
 
 class ArgsDeviceFacts(BaseModel):
     host: str = Field(description="Target switch IP address")
-    port: Optional[int] = Field(default=22)
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
     refresh: bool = Field(default=True)
 
 
 class ArgsPortInfo(BaseModel):
     host: str = Field(description="Target switch IP address")
     port_id: str = Field(description="Port identifier (e.g., '1/1/1')")
-    port: Optional[int] = Field(default=22)
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
 
 
 class ArgsPortDiscover(BaseModel):
     host: str = Field(description="Target switch IP address")
     port_id: str = Field(description="Port identifier (e.g., '1/1/1')")
-    port: Optional[int] = Field(default=22)
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
 
 
 class ArgsInterfacesDiscover(BaseModel):
     host: str = Field(description="Target switch IP address")
-    port: Optional[int] = Field(default=22)
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
     include_inactive: bool = Field(default=True)
     include_statistics: bool = Field(default=False)
 
@@ -48,30 +50,51 @@ class ArgsInterfacesDiscover(BaseModel):
 # PARSING HELPERS
 # =============================================================================
 
+# Each fact is one alternative whose named group is the facts key, so a single
+# finditer pass over the output finds all of them (m.lastgroup is the key).
+_SYSTEM_RE = re.compile(
+    r'^\s*(?:'
+    r'Name\s*:\s*(?P<system_name>.+?)'
+    r'|Description\s*:\s*(?P<description>.+?)'
+    r'|Up Time\s*:\s*(?P<uptime>.+?)'
+    r'|Contact\s*:\s*(?P<contact>.+?)'
+    r'|Location\s*:\s*(?P<location>.+?)'
+    r'),?\s*$',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+_CHASSIS_RE = re.compile(
+    r'^\s*(?:'
+    r'Serial Number\s*:\s*(?P<serial_number>\S+)'
+    r'|MAC Address\s*:\s*(?P<base_mac>[0-9a-fA-F:]+)'
+    r'|Part Number\s*:\s*(?P<part_number>.+?),?\s*$'
+    r'|Hardware Revision\s*:\s*(?P<hardware_revision>\S+)'
+    r')',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+_MODEL_RE = re.compile(r'(OS\d+[A-Z0-9-]+)')
+_VERSION_RE = re.compile(r'([\d]+\.[\d]+\.[\d]+\.R[\d]+)')
+_ADMIN_RE = re.compile(r'Admin State\s*[:\-]\s*(\S+)', re.IGNORECASE)
+_OPER_RE = re.compile(r'(?:Operational Status|Link State)\s*[:\-]\s*(\S+)', re.IGNORECASE)
+_SPEED_RE = re.compile(r'Speed\s*[:\-]\s*(.+?)[\r\n]', re.IGNORECASE)
+
+
 def parse_system_output(output: str) -> Dict[str, Any]:
     """Parse 'show system' output."""
     facts = {}
     
-    patterns = {
-        'system_name': r'^\s*Name\s*:\s*(.+?),?\s*$',
-        'description': r'^\s*Description\s*:\s*(.+?),?\s*$',
-        'uptime': r'^\s*Up Time\s*:\s*(.+?),?\s*$',
-        'contact': r'^\s*Contact\s*:\s*(.+?),?\s*$',
-        'location': r'^\s*Location\s*:\s*(.+?),?\s*$',
-    }
-    
-    for key, pattern in patterns.items():
-        match = re.search(pattern, output, re.MULTILINE | re.IGNORECASE)
-        if match:
-            facts[key] = match.group(1).strip().rstrip(',')
+    for match in _SYSTEM_RE.finditer(output):
+        # First occurrence wins, as with a per-key search
+        facts.setdefault(match.lastgroup, match.group(match.lastgroup).strip().rstrip(','))
     
     # Extract model and version from description
     if 'description' in facts:
         desc = facts['description']
-        model_match = re.search(r'(OS\d+[A-Z0-9-]+)', desc)
+        model_match = _MODEL_RE.search(desc)
         if model_match:
             facts['model'] = model_match.group(1)
-        version_match = re.search(r'([\d]+\.[\d]+\.[\d]+\.R[\d]+)', desc)
+        version_match = _VERSION_RE.search(desc)
         if version_match:
             facts['software_version'] = version_match.group(1)
     
@@ -82,17 +105,8 @@ def parse_chassis_output(output: str) -> Dict[str, Any]:
     """Parse 'show chassis' output."""
     facts = {}
     
-    patterns = {
-        'serial_number': r'^\s*Serial Number\s*:\s*(\S+)',
-        'base_mac': r'^\s*MAC Address\s*:\s*([0-9a-fA-F:]+)',
-        'part_number': r'^\s*Part Number\s*:\s*(.+?),?\s*$',
-        'hardware_revision': r'^\s*Hardware Revision\s*:\s*(\S+)',
-    }
-    
-    for key, pattern in patterns.items():
-        match = re.search(pattern, output, re.MULTILINE | re.IGNORECASE)
-        if match:
-            facts[key] = match.group(1).strip().rstrip(',')
+    for match in _CHASSIS_RE.finditer(output):
+        facts.setdefault(match.lastgroup, match.group(match.lastgroup).strip().rstrip(','))
     
     return facts
 
@@ -109,55 +123,57 @@ def handle_device_facts(
 ) -> Dict[str, Any]:
     """Get device facts (model, serial, version, etc.)."""
     parsed = ArgsDeviceFacts.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     compiled_policy = compile_policy(cfg.command_policy)
     
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
     commands = ["show system", "show chassis"]
-    results = {}
-    
-    for cmd in commands:
-        safe_cmd = sanitize_command(cmd, compiled_policy)
-        res = runner.run(device, safe_cmd, zone_resolver=zone_resolver)
-        results[cmd] = res.stdout
+    # Both commands run concurrently over one connection; any failure raises
+    results, _ = run_commands(
+        runner, device, commands, compiled_policy,
+        zone_resolver=zone_resolver, best_effort=False,
+    )
     
     # Parse outputs
     system_facts = parse_system_output(results.get("show system", ""))
     chassis_facts = parse_chassis_output(results.get("show chassis", ""))
     
-    facts = DeviceFacts(
-        system_name=system_facts.get('system_name'),
-        system_description=system_facts.get('description'),
-        model=system_facts.get('model'),
-        software_version=system_facts.get('software_version'),
-        uptime=system_facts.get('uptime'),
-        contact=system_facts.get('contact'),
-        location=system_facts.get('location'),
-        serial_number=chassis_facts.get('serial_number'),
-        base_mac=chassis_facts.get('base_mac'),
-        hardware_revision=chassis_facts.get('hardware_revision'),
-    )
+    # Values are plain strings from the parsers; no model round-trip needed
+    facts: DeviceFacts = {
+        "system_name": system_facts.get('system_name'),
+        "system_description": system_facts.get('description'),
+        "model": system_facts.get('model'),
+        "serial_number": chassis_facts.get('serial_number'),
+        "software_version": system_facts.get('software_version'),
+        "hardware_revision": chassis_facts.get('hardware_revision'),
+        "base_mac": chassis_facts.get('base_mac'),
+        "uptime": system_facts.get('uptime'),
+        "contact": system_facts.get('contact'),
+        "location": system_facts.get('location'),
+        "hardware": None,
+        "lldp": None,
+    }
     
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
     return {
         "host": device.host,
-        "hostname": facts.system_name,
-        "model": facts.model,
-        "aos_version": facts.software_version,
-        "serial_number": facts.serial_number,
-        "uptime": facts.uptime,
-        "mac_address": facts.base_mac,
-        "facts": facts.model_dump(),
+        "hostname": facts["system_name"],
+        "model": facts["model"],
+        "aos_version": facts["software_version"],
+        "serial_number": facts["serial_number"],
+        "uptime": facts["uptime"],
+        "mac_address": facts["base_mac"],
+        "facts": facts,
         "duration_ms": duration_ms,
         "content": [
             {
                 "type": "text",
                 "text": f"**Device Facts: {device.host}**\n\n"
-                       f"Model: {facts.model or 'N/A'}\n"
-                       f"Version: {facts.software_version or 'N/A'}\n"
-                       f"Serial: {facts.serial_number or 'N/A'}\n"
-                       f"Uptime: {facts.uptime or 'N/A'}"
+                       f"Model: {facts['model'] or 'N/A'}\n"
+                       f"Version: {facts['software_version'] or 'N/A'}\n"
+                       f"Serial: {facts['serial_number'] or 'N/A'}\n"
+                       f"Uptime: {facts['uptime'] or 'N/A'}"
             }
         ]
     }
@@ -171,10 +187,10 @@ def handle_port_info(
 ) -> Dict[str, Any]:
     """Get basic port information."""
     parsed = ArgsPortInfo.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     compiled_policy = compile_policy(cfg.command_policy)
     
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
     cmd = f"show interfaces port {parsed.port_id}"
     safe_cmd = sanitize_command(cmd, compiled_policy)
     res = runner.run(device, safe_cmd, zone_resolver=zone_resolver)
@@ -187,19 +203,19 @@ def handle_port_info(
     speed = None
     duplex = None
     
-    admin_match = re.search(r'Admin State\s*[:\-]\s*(\S+)', output, re.IGNORECASE)
+    admin_match = _ADMIN_RE.search(output)
     if admin_match:
         admin_state = admin_match.group(1)
     
-    oper_match = re.search(r'(?:Operational Status|Link State)\s*[:\-]\s*(\S+)', output, re.IGNORECASE)
+    oper_match = _OPER_RE.search(output)
     if oper_match:
         oper_state = oper_match.group(1)
     
-    speed_match = re.search(r'Speed\s*[:\-]\s*(.+?)[\r\n]', output, re.IGNORECASE)
+    speed_match = _SPEED_RE.search(output)
     if speed_match:
         speed = speed_match.group(1).strip()
     
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
     return {
         "host": device.host,
@@ -220,49 +236,44 @@ def handle_port_discover(
 ) -> Dict[str, Any]:
     """Comprehensive port discovery with LLDP, VLAN, MAC, PoE."""
     parsed = ArgsPortDiscover.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     compiled_policy = compile_policy(cfg.command_policy)
     
-    start_time = time.time()
-    commands_executed = []
+    start_ns = time.monotonic_ns()
     
     # Gather all port info
+    intf_cmd = f"show interfaces port {parsed.port_id}"
     commands = [
-        f"show interfaces port {parsed.port_id}",
+        intf_cmd,
         f"show vlan port {parsed.port_id}",
         f"show mac-learning port {parsed.port_id}",
         f"show lldp remote-system port {parsed.port_id}",
         f"show lanpower port {parsed.port_id}",
     ]
     
-    results = {}
-    for cmd in commands:
-        safe_cmd = sanitize_command(cmd, compiled_policy)
-        try:
-            res = runner.run(device, safe_cmd, zone_resolver=zone_resolver)
-            results[cmd.split()[1] if len(cmd.split()) > 1 else cmd] = res.stdout
-            commands_executed.append(cmd)
-        except Exception:
-            pass  # Some commands may fail on certain ports
+    # Concurrent over one connection; some commands may fail on certain ports
+    results, commands_executed = run_commands(
+        runner, device, commands, compiled_policy, zone_resolver=zone_resolver
+    )
     
     # Build interface info
-    interface = InterfaceInfo(
+    interface = InterfaceInfo.model_construct(
         port_id=parsed.port_id,
         admin_state="unknown",
         oper_state="unknown",
     )
     
     # Parse interface status
-    intf_output = results.get("interfaces", "")
+    intf_output = results.get(intf_cmd, "")
     if intf_output:
-        admin_match = re.search(r'Admin State\s*[:\-]\s*(\S+)', intf_output, re.IGNORECASE)
+        admin_match = _ADMIN_RE.search(intf_output)
         if admin_match:
             interface.admin_state = admin_match.group(1)
-        oper_match = re.search(r'(?:Operational Status|Link State)\s*[:\-]\s*(\S+)', intf_output, re.IGNORECASE)
+        oper_match = _OPER_RE.search(intf_output)
         if oper_match:
             interface.oper_state = oper_match.group(1)
     
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
     return {
         "host": device.host,
@@ -289,24 +300,21 @@ def handle_interfaces_discover(
 ) -> Dict[str, Any]:
     """Discover all interfaces on the switch."""
     parsed = ArgsInterfacesDiscover.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     compiled_policy = compile_policy(cfg.command_policy)
     
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
     
     cmd = "show interfaces status"
     safe_cmd = sanitize_command(cmd, compiled_policy)
     res = runner.run(device, safe_cmd, zone_resolver=zone_resolver)
     
-    # Parse interfaces
-    interfaces_dict = parse_interfaces_status(res.stdout)
-    interfaces = list(interfaces_dict.values())
-    
-    # Filter if needed
-    if not parsed.include_inactive:
-        interfaces = [i for i in interfaces if i.get('oper_state', '').lower() == 'up']
+    # Parse interfaces (down ports are dropped while parsing when not wanted)
+    interfaces = list(
+        parse_interfaces_status(res.stdout, include_inactive=parsed.include_inactive).values()
+    )
     
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
     return {
         "host": device.host,
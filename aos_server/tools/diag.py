@@ -23,7 +23,7 @@ class ArgsPing(BaseModel):
     host: str = Field(description="Target switch IP address")
     destination: str = Field(description="Ping destination IP or hostname")
     count: Optional[int] = Field(default=5, description="Number of ping packets")
-    port: Optional[int] = Field(default=22, description="SSH port")
+    port: Optional[int] = Field(default=22, ge=1, le=65535, description="SSH port")
     timeout_s: Optional[int] = None
 
 
@@ -31,7 +31,7 @@ class ArgsTraceroute(BaseModel):
     """Arguments for traceroute diagnostic."""
     host: str = Field(description="Target switch IP address")
     destination: str = Field(description="Traceroute destination")
-    port: Optional[int] = Field(default=22, description="SSH port")
+    port: Optional[int] = Field(default=22, ge=1, le=65535, description="SSH port")
     timeout_s: Optional[int] = None
 
 
@@ -39,36 +39,16 @@ class ArgsPoe(BaseModel):
     """Arguments for PoE diagnostics."""
     host: str = Field(description="Target switch IP address")
     slot: Optional[str] = Field(default=None, description="Slot to query (e.g., '1/1')")
-    port: Optional[int] = Field(default=22, description="SSH port")
+    port: Optional[int] = Field(default=22, ge=1, le=65535, description="SSH port")
 
 
 class ArgsPoeRestart(BaseModel):
     """Arguments for PoE port restart."""
     host: str = Field(description="Target switch IP address")
     port_id: str = Field(description="Port to restart (e.g., '1/1/1')")
-    port: Optional[int] = Field(default=22, description="SSH port")
+    port: Optional[int] = Field(default=22, ge=1, le=65535, description="SSH port")
     username: Optional[str] = None
-    wait_seconds: Optional[int] = Field(default=5, description="Seconds to wait between disable/enable")
-
-
-class PoePortInfo(BaseModel):
-    """PoE port information."""
-    port: str = Field(alias="port_id")
-    status: str
-    power_mw: int = Field(alias="power_used_mw")
-    max_power_mw: int
-    priority: str
-    poe_class: Optional[str] = Field(default=None, alias="device_class")
-
-    class Config:
-        populate_by_name = True
-
-
-class PoEChassisSummary(BaseModel):
-    """PoE chassis summary."""
-    total_power_budget_watts: int
-    power_budget_remaining_watts: int
-    actual_power_consumed_watts: int
+    wait_seconds: Optional[int] = Field(default=5, ge=0, description="Seconds to wait between disable/enable")
 
 
 # =============================================================================
@@ -83,7 +63,7 @@ def handle_ping(
 ) -> Dict[str, Any]:
     """Execute ping from switch to destination."""
     parsed = ArgsPing.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     
     compiled_policy = compile_policy(cfg.command_policy)
     cmd = format_template(cfg.templates.ping, {
@@ -113,7 +93,7 @@ def handle_traceroute(
 ) -> Dict[str, Any]:
     """Execute traceroute from switch to destination."""
     parsed = ArgsTraceroute.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     
     compiled_policy = compile_policy(cfg.command_policy)
     cmd = format_template(cfg.templates.traceroute, {
@@ -142,7 +122,7 @@ def handle_poe_diag(
 ) -> Dict[str, Any]:
     """Get PoE status for a switch slot."""
     parsed = ArgsPoe.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     
     compiled_policy = compile_policy(cfg.command_policy)
     
@@ -175,35 +155,40 @@ def handle_poe_restart(
 ) -> Dict[str, Any]:
     """Restart PoE on a specific port (disable then enable)."""
     parsed = ArgsPoeRestart.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22, parsed.username)
+    device = create_device_from_host(parsed.host, parsed.port, parsed.username)
     
     compiled_policy = compile_policy(cfg.command_policy)
-    start_time = time.time()
+    # An explicit 0 means no wait; only a missing value falls back to 5s
+    wait_seconds = parsed.wait_seconds if parsed.wait_seconds is not None else 5
+    start_ns = time.monotonic_ns()
     
-    # Disable PoE
+    # Check both commands against the policy before touching the port, so a
+    # rejected enable can never leave it powered off.
     stop_cmd = sanitize_command(
         f"lanpower port {parsed.port_id} admin-state disable",
         compiled_policy
     )
+    start_cmd = sanitize_command(
+        f"lanpower port {parsed.port_id} admin-state enable",
+        compiled_policy
+    )
+    
+    # Disable PoE
     stop_res = runner.run(device, stop_cmd, zone_resolver=zone_resolver)
     
     # Wait
-    time.sleep(parsed.wait_seconds or 5)
+    time.sleep(wait_seconds)
     
     # Enable PoE
-    start_cmd = sanitize_command(
-        f"lanpower port {parsed.port_id} admin-state enable",
-        compiled_policy
-    )
     start_res = runner.run(device, start_cmd, zone_resolver=zone_resolver)
     
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     success = stop_res.exit_status == 0 and start_res.exit_status == 0
     
     return {
         "host": device.host,
         "port_id": parsed.port_id,
-        "wait_seconds": parsed.wait_seconds or 5,
+        "wait_seconds": wait_seconds,
         "stop_command": stop_cmd,
         "start_command": start_cmd,
         "stop_result": stop_res.stdout.strip() if stop_res.stdout else "OK",
@@ -215,7 +200,7 @@ def handle_poe_restart(
                 "type": "text",
                 "text": f"{'✅' if success else '❌'} PoE restart on {parsed.port_id}: "
                        f"{'Success' if success else 'Failed'}\n"
-                       f"Wait time: {parsed.wait_seconds or 5}s"
+                       f"Wait time: {wait_seconds}s"
             }
         ]
     }
@@ -241,7 +226,7 @@ TOOLS_INFO = [
             },
             "required": ["host", "destination"]
         },
-        "output_schema": {"type": "object"}
+        "output_schema": {"type": "object"},
     },
     {
         "name": "aos.diag.traceroute",
@@ -257,7 +242,7 @@ TOOLS_INFO = [
             },
             "required": ["host", "destination"]
         },
-        "output_schema": {"type": "object"}
+        "output_schema": {"type": "object"},
     },
     {
         "name": "aos.diag.poe",
@@ -290,6 +275,7 @@ TOOLS_INFO = [
             },
             "required": ["host", "port_id"]
         },
-        "output_schema": {"type": "object"}
+        "output_schema": {"type": "object"},
+        "invalidates_cache": True,
     },
 ]
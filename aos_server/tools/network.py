@@ -3,12 +3,14 @@
 Tools: aos.mac.lookup, aos.lacp.info, aos.ntp.status, aos.dhcp.relay.info
 """
 
+import io
 import re
 import time
+from contextlib import closing
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
-from .base import create_device_from_host
+from .base import create_device_from_host, run_commands
 from ..policy import compile_policy, sanitize_command
 from ..config import AppConfig
 from ..ssh_runner import SSHRunner
@@ -21,6 +23,25 @@ from ..dhcp_parse import (
 )
 
 
+# 'show mac-learning' rows, OS6860 format: "VLAN  1098  70:4c:a5:50:45:ce  dynamic  bridging  1/1/24"
+_MAC_VLAN_RE = re.compile(r'VLAN\s+(\d+)\s+([0-9a-fA-F:]{17})\s+(dynamic|static)\s+\w+\s+(\S+)', re.IGNORECASE)
+# Standard format: "MAC Address   VLAN   Port   Type"
+_MAC_STD_RE = re.compile(r'([0-9a-fA-F:]{17})\s+(\d+)\s+(\S+)\s+(dynamic|static)', re.IGNORECASE)
+_ARP_RE = re.compile(r'(\d+\.\d+\.\d+\.\d+)\s+([0-9a-fA-F:]{17})\s+(\d+)\s+(\S+)')
+
+# 'show lldp remote-system': one alternative per field, applied with finditer
+# over the whole output. The named group is the neighbor key (m.lastgroup);
+# local_port starts a new neighbor section. Values never span lines.
+_LLDP_FIELD_RE = re.compile(
+    r'Local Port (?P<local_port>\d+/\d+/\d+)'
+    r'|(?i:Chassis (?P<remote_chassis_id>[0-9a-f:]{17}))'
+    r'|System Name[ \t]*=[ \t]*(?P<system_name>.+)'
+    r'|System Description[ \t]*=[ \t]*(?P<system_description>.+)'
+    r'|Management IP Address[ \t]*=[ \t]*(?P<management_ip>\d+\.\d+\.\d+\.\d+)'
+    r'|Capabilities Enabled[ \t]*=[ \t]*(?P<capabilities>.+)'
+)
+
+
 # =============================================================================
 # MODELS
 # =============================================================================
@@ -30,24 +51,24 @@ class ArgsMacLookup(BaseModel):
     mac_address: Optional[str] = Field(default=None, description="MAC address to lookup")
     ip_address: Optional[str] = Field(default=None, description="IP address to find MAC via ARP")
     vlan_id: Optional[int] = Field(default=None, description="Filter by VLAN")
-    port: Optional[int] = Field(default=22)
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
 
 
 class ArgsLacpInfo(BaseModel):
     host: str = Field(description="Target switch IP address")
-    port: Optional[int] = Field(default=22)
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
 
 
 class ArgsNtpStatus(BaseModel):
     host: str = Field(description="Target switch IP address")
     include_servers: bool = Field(default=True, description="Include NTP server list")
-    port: Optional[int] = Field(default=22)
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
 
 
 class ArgsDhcpRelayInfo(BaseModel):
     host: str = Field(description="Target switch IP address")
     vlan_id: Optional[int] = Field(default=None, description="Specific VLAN")
-    port: Optional[int] = Field(default=22)
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
 
 
 # =============================================================================
@@ -62,10 +83,10 @@ def handle_mac_lookup(
 ) -> Dict[str, Any]:
     """Lookup MAC address or find MAC from IP via ARP."""
     parsed = ArgsMacLookup.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     compiled_policy = compile_policy(cfg.command_policy)
     
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
     commands_executed = []
     entries = []
     
@@ -79,8 +100,10 @@ def handle_mac_lookup(
         
         # Parse MAC learning output
         for line in res.stdout.split('\n'):
+            if ':' not in line:  # every entry row carries a MAC address
+                continue
             # OS6860 format: "VLAN    1098   70:4c:a5:50:45:ce    dynamic     bridging      1/1/24"
-            match = re.search(r'VLAN\s+(\d+)\s+([0-9a-fA-F:]{17})\s+(dynamic|static)\s+\w+\s+(\S+)', line, re.IGNORECASE)
+            match = _MAC_VLAN_RE.search(line)
             if match:
                 vlan, mac_addr, mac_type, port = match.groups()
                 entries.append({
@@ -90,7 +113,7 @@ def handle_mac_lookup(
                 continue
             
             # Standard format: "MAC Address   VLAN   Port   Type"
-            std_match = re.search(r'([0-9a-fA-F:]{17})\s+(\d+)\s+(\S+)\s+(dynamic|static)', line, re.IGNORECASE)
+            std_match = _MAC_STD_RE.search(line)
             if std_match:
                 mac_addr, vlan, port, mac_type = std_match.groups()
                 entries.append({
@@ -106,7 +129,9 @@ def handle_mac_lookup(
         commands_executed.append(cmd)
         
         for line in res.stdout.split('\n'):
-            match = re.search(r'(\d+\.\d+\.\d+\.\d+)\s+([0-9a-fA-F:]{17})\s+(\d+)\s+(\S+)', line)
+            if ':' not in line:
+                continue
+            match = _ARP_RE.search(line)
             if match:
                 ip_addr, mac_addr, vlan, port = match.groups()
                 entries.append({
@@ -122,9 +147,12 @@ def handle_mac_lookup(
         res = runner.run(device, safe_cmd, timeout_s=15, zone_resolver=zone_resolver)
         commands_executed.append(cmd)
         
-        for line in res.stdout.split('\n'):
+        # Iterate lazily: the table can run to tens of thousands of lines
+        for line in io.StringIO(res.stdout):
+            if ':' not in line:
+                continue
             # OS6860 format: "VLAN    78   ac:71:2e:98:1f:3c    dynamic     bridging     1/1/1"
-            match = re.search(r'VLAN\s+(\d+)\s+([0-9a-fA-F:]{17})\s+(dynamic|static)\s+\w+\s+(\S+)', line, re.IGNORECASE)
+            match = _MAC_VLAN_RE.search(line)
             if match:
                 vlan, mac_addr, mac_type, port = match.groups()
                 # Filter by requested VLAN
@@ -134,7 +162,7 @@ def handle_mac_lookup(
                         "port": port, "type": mac_type.lower()
                     })
                 continue
-            std_match = re.search(r'([0-9a-fA-F:]{17})\s+(\d+)\s+(\S+)\s+(dynamic|static)', line, re.IGNORECASE)
+            std_match = _MAC_STD_RE.search(line)
             if std_match:
                 mac_addr, vlan, port, mac_type = std_match.groups()
                 if int(vlan) == parsed.vlan_id:
@@ -147,30 +175,37 @@ def handle_mac_lookup(
     if not parsed.mac_address and not parsed.ip_address and not parsed.vlan_id:
         cmd = "show mac-learning domain vlan"
         safe_cmd = sanitize_command(cmd, compiled_policy)
-        res = runner.run(device, safe_cmd, timeout_s=15, zone_resolver=zone_resolver)
-        commands_executed.append(cmd)
         
-        for line in res.stdout.split('\n'):
-            if len(entries) >= 100:  # Limit for LLM
-                break
-            match = re.search(r'VLAN\s+(\d+)\s+([0-9a-fA-F:]{17})\s+(dynamic|static)\s+\w+\s+(\S+)', line, re.IGNORECASE)
-            if match:
-                vlan, mac_addr, mac_type, port = match.groups()
-                entries.append({
-                    "mac_address": mac_addr, "vlan": int(vlan),
-                    "port": port, "type": mac_type.lower()
-                })
+        # Parse the table as it streams in and stop reading (closing the
+        # channel) once the limit is reached, rather than transferring it all
+        with closing(runner.stream_lines(
+            device, safe_cmd, timeout_s=15, zone_resolver=zone_resolver
+        )) as lines:
+            for line in lines:
+                if len(entries) >= 100:  # Limit for LLM
+                    break
+                if ':' not in line:
+                    continue
+                match = _MAC_VLAN_RE.search(line)
+                if match:
+                    vlan, mac_addr, mac_type, port = match.groups()
+                    entries.append({
+                        "mac_address": mac_addr, "vlan": int(vlan),
+                        "port": port, "type": mac_type.lower()
+                    })
+        commands_executed.append(cmd)
     
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
     # Build content
     if entries:
-        content_text = f"**MAC Lookup Results: {device.host}**\n\nFound: {len(entries)} entries\n"
+        parts = [f"**MAC Lookup Results: {device.host}**\n\nFound: {len(entries)} entries\n"]
         for entry in entries[:10]:
-            content_text += f"\n- MAC: {entry.get('mac_address', 'N/A')}"
+            parts.append(f"\n- MAC: {entry.get('mac_address', 'N/A')}")
             if 'ip_address' in entry:
-                content_text += f" | IP: {entry['ip_address']}"
-            content_text += f" | VLAN: {entry.get('vlan', 'N/A')} | Port: {entry.get('port', 'N/A')}"
+                parts.append(f" | IP: {entry['ip_address']}")
+            parts.append(f" | VLAN: {entry.get('vlan', 'N/A')} | Port: {entry.get('port', 'N/A')}")
+        content_text = "".join(parts)
     else:
         content_text = f"**MAC Lookup: {device.host}**\n\nNo entries found."
     
@@ -192,58 +227,56 @@ def handle_lacp_info(
 ) -> Dict[str, Any]:
     """Get LACP/Link Aggregation information."""
     parsed = ArgsLacpInfo.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     compiled_policy = compile_policy(cfg.command_policy)
     
-    start_time = time.time()
-    commands_executed = []
+    start_ns = time.monotonic_ns()
     
-    # Execute link aggregation commands
+    # Both commands run concurrently over one connection; LACP info is optional
     linkagg_cmd = "show linkagg"
-    safe_cmd = sanitize_command(linkagg_cmd, compiled_policy)
-    linkagg_result = runner.run(device, safe_cmd, timeout_s=15, zone_resolver=zone_resolver)
-    commands_executed.append(linkagg_cmd)
-    linkagg_data = parse_show_linkagg(linkagg_result.stdout)
+    lacp_cmd = "show lacp"
+    results, commands_executed = run_commands(
+        runner, device, [linkagg_cmd, lacp_cmd], compiled_policy,
+        timeout_s=15, zone_resolver=zone_resolver, required=[linkagg_cmd],
+    )
+    linkagg_data = parse_show_linkagg(results[linkagg_cmd])
     
-    # Try LACP protocol info
     lacp_data = {"lacp_enabled": False, "aggregates": []}
-    try:
-        lacp_cmd = "show lacp"
-        safe_lacp = sanitize_command(lacp_cmd, compiled_policy)
-        lacp_result = runner.run(device, safe_lacp, timeout_s=10, zone_resolver=zone_resolver)
-        commands_executed.append(lacp_cmd)
-        lacp_data = parse_show_lacp(lacp_result.stdout)
-    except Exception:
-        pass
+    if lacp_cmd in results:
+        try:
+            lacp_data = parse_show_lacp(results[lacp_cmd])
+        except Exception:
+            pass
     
     # Analyze issues
     issues = analyze_lacp_issues(lacp_data, linkagg_data)
     issues.extend(linkagg_data.get("issues", []))
     
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     lags = linkagg_data.get("lags", [])
     total_lags = linkagg_data.get("total_lags", 0)
     lacp_enabled = lacp_data.get("lacp_enabled", False)
     
     # Build content
     status_emoji = "✅" if not issues else "⚠️"
-    content_text = (
+    parts = [
         f"{status_emoji} **LACP/Link Aggregation: {device.host}**\n\n"
         f"Total LAGs: {total_lags}\n"
         f"LACP Protocol: {'Enabled' if lacp_enabled else 'Disabled'}\n"
-    )
+    ]
     
     if lags:
-        lags_up = len([lag for lag in lags if lag.get("oper_state") == "up"])
-        content_text += f"Operational LAGs: {lags_up}/{total_lags}\n"
+        lags_up = sum(1 for lag in lags if lag.get("oper_state") == "up")
+        parts.append(f"Operational LAGs: {lags_up}/{total_lags}\n")
         for lag in lags[:10]:
-            content_text += (
+            parts.append(
                 f"\n- LAG {lag['agg_id']} ({lag.get('name', 'unnamed')}): "
                 f"{lag.get('oper_state', 'unknown').upper()} - {lag.get('size', 0)} members"
             )
     
     if issues:
-        content_text += f"\n\n⚠️ Issues ({len(issues)}):\n" + "\n".join(f"- {i}" for i in issues[:10])
+        parts.append(f"\n\n⚠️ Issues ({len(issues)}):\n" + "\n".join(f"- {i}" for i in issues[:10]))
+    content_text = "".join(parts)
     
     return {
         "host": device.host,
@@ -265,33 +298,31 @@ def handle_ntp_status(
 ) -> Dict[str, Any]:
     """Get NTP synchronization status."""
     parsed = ArgsNtpStatus.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     compiled_policy = compile_policy(cfg.command_policy)
     
-    start_time = time.time()
-    commands_executed = []
+    start_ns = time.monotonic_ns()
     
-    # Get NTP status
+    # NTP status is required; the server list (if requested) is fetched
+    # concurrently over the same connection and is optional
     ntp_cmd = "show ntp status"
-    safe_cmd = sanitize_command(ntp_cmd, compiled_policy)
-    ntp_result = runner.run(device, safe_cmd, timeout_s=10, zone_resolver=zone_resolver)
-    commands_executed.append(ntp_cmd)
-    ntp_status = parse_show_ntp_status(ntp_result.stdout)
+    srv_cmd = "show ntp client server-list"
+    commands = [ntp_cmd, srv_cmd] if parsed.include_servers else [ntp_cmd]
+    results, commands_executed = run_commands(
+        runner, device, commands, compiled_policy,
+        timeout_s=10, zone_resolver=zone_resolver, required=[ntp_cmd],
+    )
+    ntp_status = parse_show_ntp_status(results[ntp_cmd])
     
-    # Get server list if requested
     servers = []
-    if parsed.include_servers:
+    if srv_cmd in results:
         try:
-            srv_cmd = "show ntp client server-list"
-            safe_srv = sanitize_command(srv_cmd, compiled_policy)
-            srv_result = runner.run(device, safe_srv, timeout_s=10, zone_resolver=zone_resolver)
-            commands_executed.append(srv_cmd)
-            servers = parse_show_ntp_client_server_list(srv_result.stdout)
+            servers = parse_show_ntp_client_server_list(results[srv_cmd])
         except Exception:
             pass
     
     issues = analyze_ntp_status(ntp_status, servers)
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
     synchronized = ntp_status.get("synchronized", False)
     mode = ntp_status.get("mode", "unknown")
@@ -301,22 +332,23 @@ def handle_ntp_status(
     
     # Build content
     status_emoji = "✅" if synchronized else "❌"
-    content_text = (
+    parts = [
         f"{status_emoji} **NTP Status: {device.host}**\n\n"
         f"Synchronized: {'Yes' if synchronized else 'No'}\n"
         f"Mode: {mode}\n"
         f"Stratum: {stratum or 'Unknown'}\n"
         f"Reference: {reference_clock or 'None'}\n"
-    )
+    ]
     
     if offset_ms is not None:
-        content_text += f"Offset: {offset_ms:.2f}ms\n"
+        parts.append(f"Offset: {offset_ms:.2f}ms\n")
     
     if servers:
-        content_text += f"\nConfigured Servers: {len(servers)}"
+        parts.append(f"\nConfigured Servers: {len(servers)}")
     
     if issues:
-        content_text += f"\n\n⚠️ Issues ({len(issues)}):\n" + "\n".join(f"- {i}" for i in issues[:10])
+        parts.append(f"\n\n⚠️ Issues ({len(issues)}):\n" + "\n".join(f"- {i}" for i in issues[:10]))
+    content_text = "".join(parts)
     
     return {
         "host": device.host,
@@ -341,32 +373,29 @@ def handle_dhcp_relay_info(
 ) -> Dict[str, Any]:
     """Get DHCP relay configuration and counters."""
     parsed = ArgsDhcpRelayInfo.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     compiled_policy = compile_policy(cfg.command_policy)
     
-    start_time = time.time()
-    commands_executed = []
+    start_ns = time.monotonic_ns()
     
-    # Get DHCP relay config (show ip dhcp-relay interface)
+    # Relay config is required; counters are fetched concurrently and optional
     relay_cmd = "show ip dhcp-relay interface"
-    safe_cmd = sanitize_command(relay_cmd, compiled_policy)
-    relay_result = runner.run(device, safe_cmd, timeout_s=10, zone_resolver=zone_resolver)
-    commands_executed.append(relay_cmd)
-    relay_config = parse_show_dhcp_relay_interface(relay_result.stdout)
+    counters_cmd = "show ip dhcp-relay counters"
+    results, commands_executed = run_commands(
+        runner, device, [relay_cmd, counters_cmd], compiled_policy,
+        timeout_s=10, zone_resolver=zone_resolver, required=[relay_cmd],
+    )
+    relay_config = parse_show_dhcp_relay_interface(results[relay_cmd])
     
-    # Get counters (show ip dhcp-relay counters)
     counters = {}
-    try:
-        counters_cmd = "show ip dhcp-relay counters"
-        safe_counters = sanitize_command(counters_cmd, compiled_policy)
-        counters_result = runner.run(device, safe_counters, timeout_s=10, zone_resolver=zone_resolver)
-        commands_executed.append(counters_cmd)
-        counters = parse_show_dhcp_relay_counters(counters_result.stdout)
-    except Exception:
-        pass
+    if counters_cmd in results:
+        try:
+            counters = parse_show_dhcp_relay_counters(results[counters_cmd])
+        except Exception:
+            pass
     
     issues = analyze_dhcp_relay(relay_config, counters)
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
     # Extract data from relay_config (now a dict)
     enabled = relay_config.get("admin_status") == "enabled"
@@ -374,25 +403,26 @@ def handle_dhcp_relay_info(
     
     # Build content
     status_emoji = "✅" if enabled and not issues else "⚠️" if issues else "ℹ️"
-    content_text = (
+    parts = [
         f"{status_emoji} **DHCP Relay: {device.host}**\n\n"
         f"Status: {'Enabled' if enabled else 'Disabled'}\n"
         f"Mode: {relay_config.get('relay_mode', 'N/A')}\n"
         f"Interfaces: {len(interfaces)}\n"
-    )
+    ]
     
     if interfaces:
         for intf in interfaces[:5]:
             servers = ", ".join(intf.get('servers', []))
-            content_text += f"\n- {intf.get('interface', 'N/A')}: {servers}"
+            parts.append(f"\n- {intf.get('interface', 'N/A')}: {servers}")
     
     if counters:
         total_req = counters.get('total_client_requests', 0)
         total_resp = counters.get('total_server_responses', 0)
-        content_text += f"\n\nClient Requests: {total_req:,} | Server Responses: {total_resp:,}"
+        parts.append(f"\n\nClient Requests: {total_req:,} | Server Responses: {total_resp:,}")
     
     if issues:
-        content_text += f"\n\n⚠️ Issues ({len(issues)}):\n" + "\n".join(f"- {i}" for i in issues[:5])
+        parts.append(f"\n\n⚠️ Issues ({len(issues)}):\n" + "\n".join(f"- {i}" for i in issues[:5]))
+    content_text = "".join(parts)
     
     return {
         "host": device.host,
@@ -413,7 +443,7 @@ def handle_dhcp_relay_info(
 class ArgsLldpNeighbors(BaseModel):
     host: str = Field(description="Target switch IP address")
     port_filter: Optional[str] = Field(default=None, description="Filter by port (e.g. '1/1/19')")
-    port: Optional[int] = Field(default=22)
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
 
 
 def handle_lldp_neighbors(
@@ -424,10 +454,10 @@ def handle_lldp_neighbors(
 ) -> Dict[str, Any]:
     """Get LLDP neighbors - useful for finding connected devices like Ruckus APs, IP phones, etc."""
     parsed = ArgsLldpNeighbors.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     compiled_policy = compile_policy(cfg.command_policy)
     
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
     
     # AOS command for LLDP remote systems
     cmd = "show lldp remote-system"
@@ -443,77 +473,59 @@ def handle_lldp_neighbors(
     neighbors = []
     current_neighbor = None
     
-    for line in result.stdout.split('\n'):
-        # Match "Remote LLDP ... on Local Port X/X/X:"
-        port_match = re.search(r'Local Port (\d+/\d+/\d+)', line)
-        if port_match:
+    for field_match in _LLDP_FIELD_RE.finditer(result.stdout):
+        key = field_match.lastgroup
+        value = field_match.group(key)
+        
+        # "Remote LLDP ... on Local Port X/X/X:" opens a new neighbor
+        if key == "local_port":
             if current_neighbor:
                 neighbors.append(current_neighbor)
+            # Sections for other ports are skipped, not built then filtered out
+            if parsed.port_filter and value != parsed.port_filter:
+                current_neighbor = None
+                continue
             current_neighbor = {
-                "local_port": port_match.group(1),
+                "local_port": value,
                 "remote_chassis_id": None,
                 "system_name": None,
                 "system_description": None,
                 "management_ip": None,
                 "capabilities": None,
             }
-            # Try to get chassis from same line or next
-            chassis_match = re.search(r'Chassis ([0-9a-f:]{17})', line, re.IGNORECASE)
-            if chassis_match:
-                current_neighbor["remote_chassis_id"] = chassis_match.group(1)
             continue
         
         if current_neighbor:
-            # Extract chassis ID from "Chassis X:X:X:X:X:X, Port..."
-            chassis_match = re.search(r'Chassis ([0-9a-f:]{17})', line, re.IGNORECASE)
-            if chassis_match:
-                current_neighbor["remote_chassis_id"] = chassis_match.group(1)
-            
-            # Extract System Name
-            name_match = re.search(r'System Name\s*=\s*(.+)', line)
-            if name_match:
-                current_neighbor["system_name"] = name_match.group(1).strip().rstrip(',')
-            
-            # Extract System Description
-            desc_match = re.search(r'System Description\s*=\s*(.+)', line)
-            if desc_match:
-                current_neighbor["system_description"] = desc_match.group(1).strip()[:100]  # Truncate
-            
-            # Extract Management IP
-            ip_match = re.search(r'Management IP Address\s*=\s*(\d+\.\d+\.\d+\.\d+)', line)
-            if ip_match:
-                current_neighbor["management_ip"] = ip_match.group(1)
-            
-            # Extract Capabilities
-            cap_match = re.search(r'Capabilities Enabled\s*=\s*(.+)', line)
-            if cap_match:
-                current_neighbor["capabilities"] = cap_match.group(1).strip().rstrip(',')
+            if key == "system_description":
+                value = value.strip()[:100]  # Truncate
+            elif key in ("system_name", "capabilities"):
+                value = value.strip().rstrip(',')
+            current_neighbor[key] = value
     
     # Don't forget the last neighbor
     if current_neighbor:
         neighbors.append(current_neighbor)
     
-    # Apply port filter if specified
-    if parsed.port_filter:
-        neighbors = [n for n in neighbors if n.get("local_port") == parsed.port_filter]
-    
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
     # Build content for LLM
-    content_text = f"**LLDP Neighbors: {device.host}**\n\n"
-    content_text += f"Total neighbors: {len(neighbors)}\n\n"
+    parts = [
+        f"**LLDP Neighbors: {device.host}**\n\n",
+        f"Total neighbors: {len(neighbors)}\n\n",
+    ]
     
     for n in neighbors[:20]:  # Limit to 20 for readability
-        content_text += f"- **Port {n.get('local_port', 'N/A')}**: "
+        parts.append(f"- **Port {n.get('local_port', 'N/A')}**: ")
         if n.get('system_name'):
-            content_text += f"{n['system_name']}"
+            parts.append(f"{n['system_name']}")
         if n.get('system_description'):
-            content_text += f" ({n['system_description'][:50]}...)"
+            parts.append(f" ({n['system_description'][:50]}...)")
         if n.get('management_ip'):
-            content_text += f" IP: {n['management_ip']}"
+            parts.append(f" IP: {n['management_ip']}")
         if n.get('remote_chassis_id'):
-            content_text += f" MAC: {n['remote_chassis_id']}"
-        content_text += "\n"
+            parts.append(f" MAC: {n['remote_chassis_id']}")
+        parts.append("\n")
+    content_text = "".join(parts)
     
     return {
         "host": device.host,
@@ -3,14 +3,20 @@
 Tools: aos.config.backup, aos.health.monitor, aos.chassis.status
 """
 
+import base64
+import gzip
+import hashlib
 import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
-from .base import create_device_from_host
+from .base import (
+    CONTENT_MODE_SCHEMA, ContentMode, create_device_from_host, run_commands, text_content,
+)
 from ..policy import compile_policy, sanitize_command
 from ..config import AppConfig
+from ..result_cache import ToolResultCache
 from ..ssh_runner import SSHRunner
 from ..health_parse import (
     parse_show_health, parse_show_chassis, parse_show_temperature,
@@ -25,13 +31,19 @@ from ..health_parse import (
 class ArgsConfigBackup(BaseModel):
     host: str = Field(description="Target switch IP address")
     username: Optional[str] = Field(default=None, description="SSH username")
-    port: Optional[int] = Field(default=22)
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
+    content: ContentMode = Field(default="full", description="Text output: full, summary or structured")
+    max_age_s: Optional[int] = Field(
+        default=None, ge=0, le=3600,
+        description="Reuse a backup of this switch taken within the last max_age_s seconds",
+    )
+    compress: bool = Field(default=False, description="Return config gzip-compressed and base64-encoded")
 
 
 class ArgsHealthMonitor(BaseModel):
     host: str = Field(description="Target switch IP address")
     detailed: bool = Field(default=False, description="Include detailed health info")
-    port: Optional[int] = Field(default=22)
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
 
 
 class ArgsChassisStatus(BaseModel):
@@ -39,13 +51,19 @@ class ArgsChassisStatus(BaseModel):
     include_temperature: bool = Field(default=True)
     include_fans: bool = Field(default=True)
     include_power: bool = Field(default=True)
-    port: Optional[int] = Field(default=22)
+    port: Optional[int] = Field(default=22, ge=1, le=65535)
 
 
 # =============================================================================
 # HANDLERS
 # =============================================================================
 
+# Recent `write terminal` captures, keyed by (host, port, username). Only kept
+# when the caller asks for reuse with max_age_s (capped by
+# cache.config_backup_max_age_s), and only for that long.
+_BACKUP_CACHE = ToolResultCache(max_entries=16)
+
+
 def handle_config_backup(
     cfg: AppConfig,
     runner: SSHRunner,
@@ -54,37 +72,82 @@ def handle_config_backup(
 ) -> Dict[str, Any]:
     """Backup running configuration."""
     parsed = ArgsConfigBackup.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22, parsed.username)
+    device = create_device_from_host(parsed.host, parsed.port, parsed.username)
     
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
     cmd = "write terminal"
-    res = runner.run(device, cmd, timeout_s=60, zone_resolver=zone_resolver)
+    cache_key = ToolResultCache.key(
+        "aos.config.backup",
+        {"host": parsed.host, "port": parsed.port, "username": parsed.username},
+    )
+    max_age_s = min(parsed.max_age_s or 0, cfg.cache.config_backup_max_age_s)
+    _BACKUP_CACHE.evict_expired()
+    capture = _BACKUP_CACHE.get(cache_key) if max_age_s else None
+    if capture is not None and time.monotonic() - capture["captured_at"] > max_age_s:
+        capture = None
+    cached = capture is not None
+    if capture is None:
+        res = runner.run(device, cmd, timeout_s=60, zone_resolver=zone_resolver)
+        config_text = res.stdout.strip()
+        capture = {
+            "captured_at": time.monotonic(),
+            "now": datetime.now(),
+            "config": config_text,
+            "config_sha256": hashlib.sha256(config_text.encode("utf-8")).hexdigest(),
+            "truncated": res.truncated,
+        }
+        if max_age_s:
+            _BACKUP_CACHE.put(cache_key, capture, max_age_s, parsed.host)
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = capture["now"]
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     filename = f"config_{parsed.host.replace('.', '_')}_{timestamp}.txt"
-    config_text = res.stdout.strip()
-    duration_ms = int((time.time() - start_time) * 1000)
+    config_text = capture["config"]
+    size_bytes = len(config_text)
+    config_sha256 = capture["config_sha256"]
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
-    return {
+    content_text = ""
+    if parsed.content != "structured":
+        content_text = (
+            f"# Configuration Backup: {parsed.host}\n"
+            f"# Filename: {filename}\n"
+            f"# Size: {size_bytes} bytes\n"
+            f"# SHA-256: {config_sha256}\n"
+            f"# Timestamp: {timestamp}\n"
+            f"# Duration: {duration_ms}ms"
+        )
+        if cached:
+            content_text += " (cached)"
+        if capture["truncated"]:
+            content_text += "\n# WARNING: output truncated at ssh.max_output_bytes"
+        # The config is already in the "config" field; only inline it for full,
+        # uncompressed text
+        if parsed.content == "full" and not parsed.compress:
+            content_text += f"\n\n```\n{config_text}\n```"
+    
+    config_field = config_text
+    if parsed.compress:
+        config_field = base64.b64encode(gzip.compress(config_text.encode("utf-8"))).decode("ascii")
+    
+    result = {
         "host": parsed.host,
-        "config": config_text,
-        "size_bytes": len(config_text),
+        "config": config_field,
+        "size_bytes": size_bytes,
+        "config_sha256": config_sha256,
         "duration_ms": duration_ms,
-        "timestamp": int(time.time()),
+        "timestamp": int(now.timestamp()),
         "filename": filename,
-        "commands_executed": [cmd],
-        "content": [
-            {
-                "type": "text",
-                "text": f"# Configuration Backup: {parsed.host}\n"
-                       f"# Filename: {filename}\n"
-                       f"# Size: {len(config_text)} bytes\n"
-                       f"# Timestamp: {timestamp}\n"
-                       f"# Duration: {duration_ms}ms\n\n"
-                       f"```\n{config_text}\n```"
-            }
-        ]
+        "commands_executed": [] if cached else [cmd],
+        "content": text_content(content_text, parsed.content)
     }
+    if capture["truncated"]:
+        result["truncated"] = True
+    if parsed.compress:
+        result["config_encoding"] = "gzip+base64"
+    if cached:
+        result["cached"] = True
+    return result
 
 
 def handle_health_monitor(
@@ -95,10 +158,10 @@ def handle_health_monitor(
 ) -> Dict[str, Any]:
     """Monitor device health (CPU, memory, modules)."""
     parsed = ArgsHealthMonitor.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     compiled_policy = compile_policy(cfg.command_policy)
     
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
     commands_executed = []
     
     health_cmd = "show health all" if parsed.detailed else "show health"
@@ -107,7 +170,7 @@ def handle_health_monitor(
     commands_executed.append(health_cmd)
     
     health_data = parse_show_health(health_result.stdout)
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
     overall_status = health_data.get("overall_status", "UNKNOWN")
     modules = health_data.get("modules", [])
@@ -115,22 +178,23 @@ def handle_health_monitor(
     
     # Build content
     status_emoji = "✅" if overall_status == "OK" else "⚠️" if overall_status == "WARNING" else "❌"
-    content_text = (
+    parts = [
         f"{status_emoji} **Health Monitor: {device.host}**\n\n"
         f"Overall Status: {overall_status}\n"
         f"Modules Monitored: {len(modules)}\n"
-    )
+    ]
     
     if modules:
         for mod in modules[:5]:
             mod_status = mod.get('status', 'N/A')
             mod_emoji = "✅" if mod_status == "OK" else "⚠️"
-            content_text += f"\n{mod_emoji} {mod.get('name', 'Module')}: {mod_status}"
+            parts.append(f"\n{mod_emoji} {mod.get('name', 'Module')}: {mod_status}")
             if mod.get('cpu_percent'):
-                content_text += f" (CPU: {mod['cpu_percent']}%)"
+                parts.append(f" (CPU: {mod['cpu_percent']}%)")
     
     if issues:
-        content_text += f"\n\n⚠️ Issues ({len(issues)}):\n" + "\n".join(f"- {i}" for i in issues[:10])
+        parts.append(f"\n\n⚠️ Issues ({len(issues)}):\n" + "\n".join(f"- {i}" for i in issues[:10]))
+    content_text = "".join(parts)
     
     return {
         "host": device.host,
@@ -151,11 +215,10 @@ def handle_chassis_status(
 ) -> Dict[str, Any]:
     """Get chassis hardware status (temperature, fans, power)."""
     parsed = ArgsChassisStatus.model_validate(args)
-    device = create_device_from_host(parsed.host, parsed.port or 22)
+    device = create_device_from_host(parsed.host, parsed.port)
     compiled_policy = compile_policy(cfg.command_policy)
     
-    start_time = time.time()
-    commands_executed = []
+    start_ns = time.monotonic_ns()
     
     # Build command list
     commands = ["show chassis"]
@@ -167,15 +230,10 @@ def handle_chassis_status(
         commands.append("show power-supply")
     commands.append("show cmm")
     
-    results = {}
-    for cmd in commands:
-        try:
-            safe_cmd = sanitize_command(cmd, compiled_policy)
-            res = runner.run(device, safe_cmd, timeout_s=15, zone_resolver=zone_resolver)
-            results[cmd] = res.stdout
-            commands_executed.append(cmd)
-        except Exception:
-            pass
+    # Concurrent over one connection; unsupported commands are just skipped
+    results, commands_executed = run_commands(
+        runner, device, commands, compiled_policy, timeout_s=15, zone_resolver=zone_resolver
+    )
     
     # Parse results
     chassis_data = parse_show_chassis(results.get("show chassis", ""))
@@ -189,47 +247,48 @@ def handle_chassis_status(
     if temp_data and temp_data.get("issues"):
         issues.extend(temp_data["issues"])
     
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
     
     # Build content
-    content_text = (
+    parts = [
         f"**Chassis Status: {device.host}**\n\n"
         f"Model: {chassis_data.get('chassis_type', 'Unknown')}\n"
         f"Serial: {chassis_data.get('serial_number', 'Unknown')}\n"
         f"MAC: {chassis_data.get('mac_address', 'Unknown')}\n"
         f"Hardware Rev: {chassis_data.get('hardware_revision', 'Unknown')}\n"
-    )
+    ]
     
     if cmm_data:
-        content_text += "\n**CMM Status:**\n"
+        parts.append("\n**CMM Status:**\n")
         if cmm_data.get("primary"):
             p = cmm_data["primary"]
-            content_text += f"- Primary (Slot {p.get('slot', 'N/A')}): {p.get('status', 'N/A')}"
+            parts.append(f"- Primary (Slot {p.get('slot', 'N/A')}): {p.get('status', 'N/A')}")
             if p.get("temperature_celsius"):
-                content_text += f" - {p['temperature_celsius']}°C"
-            content_text += "\n"
+                parts.append(f" - {p['temperature_celsius']}°C")
+            parts.append("\n")
         if cmm_data.get("secondary"):
             s = cmm_data["secondary"]
-            content_text += f"- Secondary (Slot {s.get('slot', 'N/A')}): {s.get('status', 'N/A')}"
+            parts.append(f"- Secondary (Slot {s.get('slot', 'N/A')}): {s.get('status', 'N/A')}")
             if s.get("temperature_celsius"):
-                content_text += f" - {s['temperature_celsius']}°C"
-            content_text += "\n"
+                parts.append(f" - {s['temperature_celsius']}°C")
+            parts.append("\n")
     
     if temp_data:
         temp_val = temp_data.get("current_celsius") or temp_data.get("temperature")
         if temp_val:
-            content_text += f"\nTemperature: {temp_val}°C"
+            parts.append(f"\nTemperature: {temp_val}°C")
     
     if fan_data:
         fans_ok = sum(1 for f in fan_data if f.get("status", "").lower() == "ok")
-        content_text += f"\nFans: {fans_ok}/{len(fan_data)} OK"
+        parts.append(f"\nFans: {fans_ok}/{len(fan_data)} OK")
     
     if psu_data:
-        psu_ok = sum(1 for p in psu_data if p.get("status", "").lower() in ["ok", "up"])
-        content_text += f"\nPower Supplies: {psu_ok}/{len(psu_data)} OK"
+        psu_ok = sum(1 for p in psu_data if p.get("status", "").lower() in ("ok", "up"))
+        parts.append(f"\nPower Supplies: {psu_ok}/{len(psu_data)} OK")
     
     if issues:
-        content_text += f"\n\n⚠️ Hardware Issues ({len(issues)}):\n" + "\n".join(f"- {i}" for i in issues[:10])
+        parts.append(f"\n\n⚠️ Hardware Issues ({len(issues)}):\n" + "\n".join(f"- {i}" for i in issues[:10]))
+    content_text = "".join(parts)
     
     return {
         "host": device.host,
@@ -264,6 +323,20 @@ TOOLS_INFO = [
             "properties": {
                 "host": {"type": "string", "description": "Switch IP address"},
                 "username": {"type": "string", "description": "SSH username (optional)"},
+                "content": CONTENT_MODE_SCHEMA,
+                "max_age_s": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "maximum": 3600,
+                    "description": "Reuse a backup taken within this many seconds instead of re-reading "
+                                   "the config, up to the server's cache.config_backup_max_age_s "
+                                   "(default: always read fresh)",
+                },
+                "compress": {
+                    "type": "boolean",
+                    "description": "Return config gzip-compressed and base64-encoded "
+                                   "(config_encoding: gzip+base64) and leave it out of the text content",
+                },
             },
             "required": ["host"]
         },
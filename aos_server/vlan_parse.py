@@ -3,7 +3,26 @@ VLAN parsing utilities for AOS OmniSwitch.
 """
 
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Column header and data row of 'show vlan': vlan type admin oper ip mtu name
+_VLAN_HEADER_RE = re.compile(r'\s*vlan\s+type\b', re.IGNORECASE)
+_VLAN_ROW_RE = re.compile(r'\s*(\d+)\s+(\w+)\s+(Ena|Dis)\s+(Ena|Dis)\s+(Ena|Dis)\s+(\d+)\s+(.*)$')
+
+def _mtu_value(value: str) -> Optional[int]:
+    return int(value) if value.isdigit() else None
+
+
+# 'show vlan <id>' keys -> (vlan_detail field name, value converter)
+_VLAN_DETAIL_FIELDS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "Name": ("name", str),
+    "Type": ("type", str),
+    "Administrative State": ("admin_state", str),
+    "Operational State": ("oper_state", str),
+    "IP Routing": ("ip_routing", str),
+    "IP MTU": ("mtu", _mtu_value),
+    "MAC Tunneling": ("mac_tunneling", str),
+}
 
 
 def parse_show_vlan(output: str) -> List[Dict[str, any]]:
@@ -19,21 +38,17 @@ def parse_show_vlan(output: str) -> List[Dict[str, any]]:
     Returns list of dicts with VLAN info.
     """
     vlans = []
-    lines = output.strip().split('\n')
     
-    for line in lines:
-        # Skip headers and separators
-        if 'vlan' in line.lower() and 'type' in line.lower():
+    for line in output.splitlines():
+        # Skip blank lines, separators and the column header
+        if not line or line[0] == '-' or '----' in line:
             continue
-        if '----' in line or not line.strip():
+        if _VLAN_HEADER_RE.match(line):
             continue
         
         # Parse: vlan type admin oper ip mtu name
         # Example: 1      std       Ena     Dis   Dis    1500    NE PAS UTILISER
-        match = re.match(
-            r'\s*(\d+)\s+(\w+)\s+(Ena|Dis)\s+(Ena|Dis)\s+(Ena|Dis)\s+(\d+)\s+(.*)$',
-            line
-        )
+        match = _VLAN_ROW_RE.match(line)
         
         if match:
             vlan_id = int(match.group(1))
@@ -74,39 +89,41 @@ def parse_show_vlan_detail(output: str) -> Dict[str, any]:
     """
     vlan_detail = {}
     
-    lines = output.strip().split('\n')
-    
-    for line in lines:
-        # Parse key-value pairs
-        if ':' in line:
-            parts = line.split(':', 1)
-            if len(parts) == 2:
-                key = parts[0].strip()
-                value = parts[1].strip().rstrip(',')
-                
-                # Map keys to standard field names
-                if key == "Name":
-                    vlan_detail['name'] = value
-                elif key == "Type":
-                    vlan_detail['type'] = value
-                elif key == "Administrative State":
-                    vlan_detail['admin_state'] = value
-                elif key == "Operational State":
-                    vlan_detail['oper_state'] = value
-                elif key == "IP Routing":
-                    vlan_detail['ip_routing'] = value
-                elif key == "IP MTU":
-                    vlan_detail['mtu'] = int(value) if value.isdigit() else None
-                elif key == "MAC Tunneling":
-                    vlan_detail['mac_tunneling'] = value
+    for line in output.splitlines():
+        # Parse key-value pairs, mapping keys to standard field names
+        key, sep, value = line.partition(':')
+        if not sep:
+            continue
+        field = _VLAN_DETAIL_FIELDS.get(key.strip())
+        if field is None:
+            continue
+        name, convert = field
+        vlan_detail[name] = convert(value.strip().rstrip(','))
     
     return vlan_detail
 
 
-def analyze_vlan_config(vlans: List[Dict[str, any]]) -> Tuple[Dict[str, int], List[str]]:
+# Issues are detected as (code, vlan_id, name) tuples and only formatted for
+# the ones returned.
+VLAN_ISSUE_FORMATS = {
+    "ENABLED_BUT_DOWN": "VLAN {vlan_id} ({name}): Enabled but operationally down",
+    "DEFAULT_VLAN_ENABLED": "VLAN 1: Default VLAN is enabled - consider disabling if unused",
+    "SUSPICIOUS_NAME": "VLAN {vlan_id} ({name}): Suspicious name suggests temporary/test VLAN",
+}
+
+_SUSPICIOUS_NAME_KEYWORDS = ('test', 'temp', 'old', 'unused', 'ne pas', 'poubelle', 'toto')
+_SUSPICIOUS_NAME_RE = re.compile('|'.join(map(re.escape, _SUSPICIOUS_NAME_KEYWORDS)))
+
+
+def analyze_vlan_config(
+    vlans: List[Dict[str, any]], max_issues: Optional[int] = None
+) -> Tuple[Dict[str, int], List[str]]:
     """
     Analyze VLAN configuration and detect potential issues.
     
+    Only the first max_issues issues are formatted; summary['issues_total']
+    always holds the full count.
+    
     Returns:
         - summary: Dict with statistics
         - issues: List of detected configuration issues
@@ -120,9 +137,10 @@ def analyze_vlan_config(vlans: List[Dict[str, any]]) -> Tuple[Dict[str, int], Li
         'with_ip_routing': 0,
         'std_vlans': 0,
         'vcm_vlans': 0,
+        'issues_total': 0,
     }
     
-    issues = []
+    found: List[Tuple[str, int, str]] = []
     
     for vlan in vlans:
         vlan_id = vlan['vlan_id']
@@ -133,15 +151,8 @@ def analyze_vlan_config(vlans: List[Dict[str, any]]) -> Tuple[Dict[str, int], Li
         vlan_type = vlan['type']
         
         # Count states
-        if admin == 'Ena':
-            summary['enabled'] += 1
-        else:
-            summary['disabled'] += 1
-        
-        if oper == 'Ena':
-            summary['operational'] += 1
-        else:
-            summary['down'] += 1
+        summary['enabled' if admin == 'Ena' else 'disabled'] += 1
+        summary['operational' if oper == 'Ena' else 'down'] += 1
         
         if ip_routing == 'Ena':
             summary['with_ip_routing'] += 1
@@ -153,13 +164,20 @@ def analyze_vlan_config(vlans: List[Dict[str, any]]) -> Tuple[Dict[str, int], Li
         
         # Detect issues
         if admin == 'Ena' and oper == 'Dis':
-            issues.append(f"VLAN {vlan_id} ({name}): Enabled but operationally down")
+            found.append(("ENABLED_BUT_DOWN", vlan_id, name))
         
         if vlan_id == 1 and admin == 'Ena':
-            issues.append(f"VLAN 1: Default VLAN is enabled - consider disabling if unused")
+            found.append(("DEFAULT_VLAN_ENABLED", vlan_id, name))
         
         # Check for suspicious names
-        if any(keyword in name.lower() for keyword in ['test', 'temp', 'old', 'unused', 'ne pas', 'poubelle', 'toto']):
-            issues.append(f"VLAN {vlan_id} ({name}): Suspicious name suggests temporary/test VLAN")
+        if _SUSPICIOUS_NAME_RE.search(name.lower()):
+            found.append(("SUSPICIOUS_NAME", vlan_id, name))
     
+    summary['issues_total'] = len(found)
+    if max_issues is not None:
+        found = found[:max_issues]
+    issues = [
+        VLAN_ISSUE_FORMATS[code].format(vlan_id=vlan_id, name=name)
+        for code, vlan_id, name in found
+    ]
     return summary, issues
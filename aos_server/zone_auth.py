@@ -7,12 +7,16 @@ Example: 10.9.x.x → Zone 9, 10.1.x.x → Zone 1
 
 import logging
 import os
-import re
-from typing import Optional, List, Tuple
+import socket
+import threading
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on hosts whose resolved credentials are kept
+_HOST_CACHE_MAX = 1024
+
 
 @dataclass
 class ZoneCredentials:
@@ -37,19 +41,20 @@ def extract_zone_from_ip(host: str) -> Optional[int]:
         192.168.1.1 → 168
         switch.example.com → None
     """
-    # Match IPv4 address
-    match = re.match(r'^(\d+)\.(\d+)\.(\d+)\.(\d+)$', host)
-    if not match:
-        logger.debug(f"Host '{host}' is not a valid IPv4, cannot extract zone")
+    # Inventories may zero-pad octets (10.001.5.1), which inet_pton rejects,
+    # so strip the padding first; inet_pton then checks the octet ranges
+    octets = host.split('.')
+    if len(octets) != 4 or not all(o.isascii() and o.isdigit() for o in octets):
+        logger.debug("Host '%s' is not a valid IPv4, cannot extract zone", host)
         return None
-    
-    octets = [int(x) for x in match.groups()]
-    if any(o < 0 or o > 255 for o in octets):
-        logger.debug(f"Host '{host}' has invalid octets")
+    try:
+        packed = socket.inet_pton(socket.AF_INET, '.'.join(str(int(o)) for o in octets))
+    except OSError:
+        logger.debug("Host '%s' is not a valid IPv4, cannot extract zone", host)
         return None
     
-    zone_id = octets[1]  # Second octet
-    logger.debug(f"Extracted zone {zone_id} from IP {host}")
+    zone_id = packed[1]  # Second octet
+    logger.debug("Extracted zone %s from IP %s", zone_id, host)
     return zone_id
 
 
@@ -70,6 +75,10 @@ class ZoneAuthResolver:
                 }
         """
         self.zone_config = zone_config or {}
+        # host -> resolved credentials; env vars are read once per host. Tool
+        # calls run in worker threads, so the cache is guarded by a lock.
+        self._host_cache: Dict[str, List[ZoneCredentials]] = {}
+        self._host_cache_lock = threading.Lock()
         self._log_config()
     
     def _log_config(self):
@@ -130,12 +139,30 @@ class ZoneAuthResolver:
         1. Global credentials (try first)
         2. Zone-specific credentials (fallback)
         
+        Results are cached per host for the life of the resolver (the process
+        environment does not change underneath it); the returned
+        ZoneCredentials are shared and must not be modified.
+        
         Args:
             host: IP address or hostname
             
         Returns:
             List of ZoneCredentials to try (may be empty if no config)
         """
+        with self._host_cache_lock:
+            cached = self._host_cache.get(host)
+        if cached is not None:
+            return list(cached)
+        
+        credentials_list = self._resolve_for_host(host)
+        with self._host_cache_lock:
+            if host not in self._host_cache and len(self._host_cache) >= _HOST_CACHE_MAX:
+                # Drop the oldest entry; hosts come from tool arguments
+                del self._host_cache[next(iter(self._host_cache))]
+            self._host_cache[host] = credentials_list
+        return list(credentials_list)
+    
+    def _resolve_for_host(self, host: str) -> List[ZoneCredentials]:
         if not self.zone_config:
             logger.debug("No zone config, returning empty credentials list")
             return []
@@ -0,0 +1,174 @@
+"""Shared fixtures: scripted stand-ins for a switch and its SSH transport."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Union
+
+import paramiko
+import pytest
+
+from aos_server import ssh_runner
+from aos_server.config import AppConfig, AuthPasswordInline, Device, SSHConfig
+from aos_server.ssh_runner import SSHResult, SSHRunner
+
+# What a fake switch sends for a command: raw output, output split into the
+# chunks channel.recv() returns (an exception chunk is raised when read), or an
+# exception raised by exec_command.
+FakeOutput = Union[bytes, Sequence[bytes], BaseException]
+
+
+class FakeRunner:
+    """Answers commands from a {command: stdout} map; unknown commands fail."""
+
+    def __init__(self, outputs: Dict[str, str]):
+        self.outputs = outputs
+        self.calls: List[str] = []
+
+    def _one(self, command: str) -> SSHResult:
+        self.calls.append(command)
+        if command not in self.outputs:
+            raise RuntimeError(f"no output for {command!r}")
+        return SSHResult(stdout=self.outputs[command], stderr="", exit_status=0, duration_ms=1)
+
+    def run(self, device, command, timeout_s: Optional[int] = None, zone_resolver=None):
+        return self._one(command)
+
+    def run_batch(self, device, commands, timeout_s: Optional[int] = None, zone_resolver=None):
+        out = {}
+        for command in commands:
+            try:
+                out[command] = self._one(command)
+            except Exception as e:
+                out[command] = e
+        return out
+
+    def stream_lines(self, device, command, timeout_s: Optional[int] = None, zone_resolver=None):
+        yield from self._one(command).stdout.splitlines(keepends=True)
+
+
+class FakeChannel:
+    def __init__(self, chunks: Sequence[bytes]):
+        self.chunks = list(chunks)
+        self.closed = False
+
+    def recv(self, nbytes: int) -> bytes:
+        chunk = self.chunks.pop(0) if self.chunks else b""
+        if isinstance(chunk, BaseException):
+            raise chunk
+        return chunk
+
+    def recv_exit_status(self) -> int:
+        return 0
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeStdout:
+    def __init__(self, channel: FakeChannel):
+        self.channel = channel
+
+    def read(self, nbytes: int = -1) -> bytes:
+        chunks, self.channel.chunks = self.channel.chunks, []
+        for chunk in chunks:
+            if isinstance(chunk, BaseException):
+                raise chunk
+        data = b"".join(chunks)
+        return data if nbytes < 0 else data[:nbytes]
+
+
+class FakeTransport:
+    def __init__(self):
+        self.active = True
+
+    def is_active(self) -> bool:
+        return self.active
+
+
+class FakeSSHClient:
+    """paramiko.SSHClient stand-in whose exec channels replay scripted output."""
+
+    def __init__(self, outputs: Dict[str, FakeOutput]):
+        self.outputs = outputs
+        self.transport = FakeTransport()
+        self.commands: List[str] = []
+        self.channels: List[FakeChannel] = []
+        # Simulate the switch having dropped the session: the transport still
+        # looks alive until the next exec_command fails
+        self.dead_on_exec = False
+
+    def get_transport(self) -> FakeTransport:
+        return self.transport
+
+    def exec_command(self, command: str, timeout: Optional[int] = None):
+        if self.dead_on_exec:
+            self.transport.active = False
+        if not self.transport.active:
+            raise paramiko.SSHException("SSH session not active")
+        self.commands.append(command)
+        output = self.outputs.get(command, b"")
+        if isinstance(output, BaseException):
+            raise output
+        channel = FakeChannel([output] if isinstance(output, bytes) else output)
+        self.channels.append(channel)
+        return None, FakeStdout(channel), FakeStdout(FakeChannel([]))
+
+    def close(self) -> None:
+        self.transport.active = False
+
+
+class FakeSSH:
+    """Replaces ssh_runner._connect; every connection is a FakeSSHClient."""
+
+    def __init__(self):
+        self.outputs: Dict[str, FakeOutput] = {}
+        self.clients: List[FakeSSHClient] = []
+
+    def connect(self, cfg, host, port, username, auth, *, sock_obj=None) -> FakeSSHClient:
+        client = FakeSSHClient(self.outputs)
+        self.clients.append(client)
+        return client
+
+    def runner(self, **ssh_overrides) -> SSHRunner:
+        return SSHRunner(
+            SSHConfig(**ssh_overrides),
+            jump_hosts={},
+            default_device_username="admin",
+            default_device_auth=AuthPasswordInline(type="password_inline", password="secret"),
+        )
+
+
+@pytest.fixture
+def fake_ssh(monkeypatch) -> FakeSSH:
+    fake = FakeSSH()
+    monkeypatch.setattr(ssh_runner, "_connect", fake.connect)
+    return fake
+
+
+@pytest.fixture
+def device() -> Device:
+    return Device(id="sw1", host="10.0.0.1")
+
+
+@pytest.fixture
+def cfg() -> AppConfig:
+    return AppConfig.model_validate(
+        {"command_policy": {"allow_regex": [r"^show\s+.*$", r"^write\s+terminal$"]}}
+    )
+
+
+@pytest.fixture
+def make_runner():
+    return FakeRunner
+
+
+@pytest.fixture(autouse=True)
+def _clear_result_caches():
+    from aos_server.tools import _RESULT_CACHE
+    from aos_server.tools.system import _BACKUP_CACHE
+
+    for cache in (_RESULT_CACHE, _BACKUP_CACHE):
+        cache.clear()
+    yield
+    for cache in (_RESULT_CACHE, _BACKUP_CACHE):
+        cache.clear()
@@ -0,0 +1,43 @@
+from aos_server.tools import call_tool
+
+SPANTREE_OUTPUTS = {
+    "show spantree mode": "Spanning Tree Global Parameters\n  Current Running Mode : Flat,\n",
+    "show spantree cist": "Spanning Tree Status : ON,\n  Bridge ID : 8000-aa:bb:cc:dd:ee:ff,\n",
+    "show spantree cist ports": (
+        " Msti Port Oper Status Path Cost Role Loop Guard Note\n"
+        "-----+------\n"
+        " 0 1/1/1 FORW 20000 ROOT DIS\n"
+        " 0 1/1/2 BLK 20000 ALT DIS\n"
+        " 0 1/1/3 BLK 20000 BKUP DIS\n"
+        " 0 1/1/4 DIS 0 DIS DIS\n"
+    ),
+}
+
+
+def _spantree_audit(cfg, runner):
+    return call_tool(cfg, None, runner, None, "aos.spantree.audit", {"host": "10.0.0.1"})
+
+
+def test_spantree_alternate_and_backup_ports_are_not_issues(cfg, make_runner):
+    result = _spantree_audit(cfg, make_runner(SPANTREE_OUTPUTS))
+
+    assert result["issues"] == []
+    assert result["forwarding_ports"] == 1
+    assert result["blocking_ports"] == 2
+
+
+def test_spantree_blocked_designated_and_root_ports_are_issues(cfg, make_runner):
+    outputs = dict(SPANTREE_OUTPUTS)
+    outputs["show spantree cist ports"] = (
+        " Msti Port Oper Status Path Cost Role Loop Guard Note\n"
+        "-----+------\n"
+        " 0 1/1/1 BLK 20000 ROOT DIS\n"
+        " 0 1/1/2 BLK 20000 DESG DIS\n"
+    )
+
+    result = _spantree_audit(cfg, make_runner(outputs))
+
+    assert result["issues"] == [
+        "Root port 1/1/1 is not forwarding",
+        "Port 1/1/2 in unusual state: BLK",
+    ]
@@ -0,0 +1,31 @@
+import socket
+
+import pytest
+
+from aos_server.policy import compile_policy
+from aos_server.ssh_runner import SSHExecutionError
+from aos_server.tools.base import run_commands
+
+
+def test_run_commands_reports_why_a_required_command_failed(fake_ssh, device, cfg):
+    fake_ssh.outputs["show system"] = b"System:\n"
+    fake_ssh.outputs["show chassis"] = socket.timeout("timed out")
+    policy = compile_policy(cfg.command_policy)
+
+    with pytest.raises(SSHExecutionError, match=r"show chassis: timed out") as excinfo:
+        run_commands(fake_ssh.runner(), device, ["show system", "show chassis"], policy, best_effort=False)
+
+    assert isinstance(excinfo.value.__cause__, socket.timeout)
+
+
+def test_run_commands_best_effort_skips_failed_optional_commands(fake_ssh, device, cfg):
+    fake_ssh.outputs["show system"] = b"System:\n"
+    fake_ssh.outputs["show chassis"] = socket.timeout("timed out")
+    policy = compile_policy(cfg.command_policy)
+
+    results, executed = run_commands(
+        fake_ssh.runner(), device, ["show system", "show chassis"], policy, required=["show system"]
+    )
+
+    assert results == {"show system": "System:\n"}
+    assert executed == ["show system"]
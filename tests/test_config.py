@@ -0,0 +1,16 @@
+import pytest
+from pydantic import ValidationError
+
+from aos_server.config import SSHConfig
+
+
+def test_ssh_pooling_and_parallel_channels_are_opt_in():
+    cfg = SSHConfig()
+
+    assert cfg.pool_connections is False
+    assert cfg.max_parallel_channels == 1
+
+
+def test_parallel_channels_must_fit_on_one_connection():
+    with pytest.raises(ValidationError, match="max_parallel_channels"):
+        SSHConfig(max_parallel_channels=10, max_channels_per_connection=8)
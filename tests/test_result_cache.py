@@ -0,0 +1,72 @@
+import pytest
+
+from aos_server.config import AppConfig
+from aos_server.result_cache import ToolResultCache
+from aos_server.tools import call_tool
+
+SPANTREE_OUTPUTS = {
+    "show spantree mode": "Spanning Tree Global Parameters\n  Current Running Mode : Flat,\n",
+    "show spantree cist": "Spanning Tree Status : ON,\n",
+    "show spantree cist ports": "",
+}
+
+
+@pytest.fixture
+def caching_cfg(cfg) -> AppConfig:
+    return cfg.model_copy(update={"cache": cfg.cache.model_copy(update={"tool_results": True})})
+
+
+def test_result_cache_is_off_by_default(cfg, make_runner):
+    runner = make_runner(SPANTREE_OUTPUTS)
+
+    call_tool(cfg, None, runner, None, "aos.spantree.audit", {"host": "10.0.0.1"})
+    result = call_tool(cfg, None, runner, None, "aos.spantree.audit", {"host": "10.0.0.1"})
+
+    assert "cached" not in result
+    assert runner.calls.count("show spantree mode") == 2
+
+
+def test_equivalent_arguments_share_a_cache_entry(caching_cfg, make_runner):
+    runner = make_runner(SPANTREE_OUTPUTS)
+
+    call_tool(caching_cfg, None, runner, None, "aos.spantree.audit", {"host": "10.0.0.1"})
+    result = call_tool(
+        caching_cfg, None, runner, None, "aos.spantree.audit",
+        {"host": "10.0.0.1", "port": 22, "content": "full"},
+    )
+
+    assert result["cached"] is True
+    assert runner.calls.count("show spantree mode") == 1
+
+
+def test_failed_invalidating_tool_still_flushes_the_host(caching_cfg, make_runner):
+    runner = make_runner(SPANTREE_OUTPUTS)
+    call_tool(caching_cfg, None, runner, None, "aos.spantree.audit", {"host": "10.0.0.1"})
+
+    # The policy rejects the command, so the tool fails
+    with pytest.raises(ValueError):
+        call_tool(caching_cfg, None, runner, None, "aos.cli.readonly", {"host": "10.0.0.1", "command": "reload"})
+    result = call_tool(caching_cfg, None, runner, None, "aos.spantree.audit", {"host": "10.0.0.1"})
+
+    assert "cached" not in result
+    assert runner.calls.count("show spantree mode") == 2
+
+
+def test_tool_result_cache_expiry_and_invalidation(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("aos_server.result_cache.time.monotonic", lambda: now[0])
+    cache = ToolResultCache(max_entries=2)
+    key_a = cache.key("tool", {"host": "a"})
+    key_b = cache.key("tool", {"host": "b"})
+
+    cache.put(key_a, {"x": 1}, ttl_s=10, host="a")
+    cache.put(key_b, {"x": 2}, ttl_s=30, host="b")
+    copy = cache.get(key_a)
+    copy["x"] = 99
+
+    assert cache.get(key_a) == {"x": 1}
+    now[0] += 20
+    assert cache.get(key_a) is None
+    assert cache.get(key_b) == {"x": 2}
+    cache.invalidate_host("b")
+    assert cache.get(key_b) is None
@@ -0,0 +1,159 @@
+import threading
+
+import pytest
+
+from aos_server import ssh_pool
+from aos_server.ssh_pool import HostChannelLimiter, PooledConnection, SSHConnectionPool
+
+
+class _Transport:
+    active = True
+
+    def is_active(self):
+        return self.active
+
+
+class _Client:
+    def __init__(self):
+        self.transport = _Transport()
+
+    def get_transport(self):
+        return self.transport
+
+    def close(self):
+        self.transport.active = False
+
+
+def _factory(opened):
+    def open_connection():
+        conn = PooledConnection(client=_Client())
+        opened.append(conn)
+        return conn
+
+    return open_connection
+
+
+def test_pool_reuses_a_released_connection():
+    pool = SSHConnectionPool(max_channels=4)
+    opened = []
+
+    conn, reused = pool.acquire("a", _factory(opened))
+    pool.release(conn)
+    again, reused_again = pool.acquire("a", _factory(opened))
+
+    assert (reused, reused_again) == (False, True)
+    assert again is conn
+    assert len(opened) == 1
+
+
+def test_pool_opens_another_connection_when_channels_are_exhausted():
+    pool = SSHConnectionPool(max_channels=2)
+    opened = []
+
+    first, _ = pool.acquire("a", _factory(opened), channels=2)
+    second, reused = pool.acquire("a", _factory(opened))
+
+    assert second is not first
+    assert reused is False
+
+
+def test_pool_drops_dead_connections():
+    pool = SSHConnectionPool(max_channels=4)
+    opened = []
+    conn, _ = pool.acquire("a", _factory(opened))
+    pool.release(conn)
+    conn.client.transport.active = False
+
+    fresh, reused = pool.acquire("a", _factory(opened))
+
+    assert fresh is not conn
+    assert reused is False
+
+
+def test_pool_evicts_least_recently_used_idle_connections(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ssh_pool.time, "monotonic", lambda: now[0])
+    pool = SSHConnectionPool(max_channels=4, max_connections=2)
+    opened = []
+
+    for key in ("a", "b"):
+        conn, _ = pool.acquire(key, _factory(opened))
+        now[0] += 1
+        pool.release(conn)
+    # "a" is the least recently used once "c" pushes the pool over its limit
+    pool.acquire("c", _factory(opened))
+
+    assert [c.client.transport.active for c in opened] == [False, True, True]
+
+
+def test_pool_never_evicts_connections_in_use():
+    pool = SSHConnectionPool(max_channels=4, max_connections=1)
+    opened = []
+
+    pool.acquire("a", _factory(opened))
+    pool.acquire("b", _factory(opened))
+
+    assert all(c.client.transport.active for c in opened)
+
+
+def test_pool_closes_idle_connections(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ssh_pool.time, "monotonic", lambda: now[0])
+    pool = SSHConnectionPool(max_channels=4, idle_timeout_s=60)
+    opened = []
+    conn, _ = pool.acquire("a", _factory(opened))
+    pool.release(conn)
+
+    now[0] += 30
+    pool.evict_idle()
+    assert conn.client.transport.active
+    now[0] += 31
+    pool.evict_idle()
+    assert not conn.client.transport.active
+
+
+@pytest.mark.parametrize("requested, granted", [(0, 1), (1, 1), (3, 3), (10, 4)])
+def test_limiter_clamps_channel_requests(requested, granted):
+    assert HostChannelLimiter(4).clamp(requested) == granted
+
+
+def test_limiter_blocks_until_the_host_has_room():
+    limiter = HostChannelLimiter(4)
+    limiter.acquire("sw1", 10)  # clamped to 4 instead of waiting forever
+    acquired = threading.Event()
+
+    def other_call():
+        limiter.acquire("sw1", 1)
+        acquired.set()
+
+    thread = threading.Thread(target=other_call)
+    thread.start()
+    assert not acquired.wait(0.1)
+    limiter.acquire("sw2", 4)  # other switches are unaffected
+    limiter.release("sw1", 10)
+    assert acquired.wait(1)
+    thread.join()
+
+
+def test_limiter_gives_up_after_the_timeout():
+    limiter = HostChannelLimiter(1)
+    assert limiter.acquire("sw1", timeout_s=0.1)
+    assert not limiter.acquire("sw1", timeout_s=0.1)
+    limiter.release("sw1")
+    assert limiter.acquire("sw1", timeout_s=0.1)
+
+
+def test_pool_forgets_keys_whose_connections_are_gone(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ssh_pool.time, "monotonic", lambda: now[0])
+    pool = SSHConnectionPool(max_channels=4, idle_timeout_s=60)
+    opened = []
+    for key in ("a", "b"):
+        conn, _ = pool.acquire(key, _factory(opened))
+        pool.release(conn)
+
+    now[0] += 61
+    pool.evict_idle()
+
+    assert pool._conns == {}
+    assert pool._connect_locks == {}
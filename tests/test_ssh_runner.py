@@ -0,0 +1,116 @@
+import logging
+import socket
+
+import pytest
+
+from aos_server.config import AuthPasswordInline, Device
+from aos_server.ssh_runner import SSHExecutionError, SSHResult
+
+
+def test_run_batch_records_failed_commands(fake_ssh, device, caplog):
+    fake_ssh.outputs["show a"] = b"output a\n"
+    fake_ssh.outputs["show b"] = socket.timeout("timed out")
+    runner = fake_ssh.runner()
+
+    with caplog.at_level(logging.WARNING, logger="aos_server.ssh_runner"):
+        results = runner.run_batch(device, ["show a", "show b"])
+
+    assert list(results) == ["show a", "show b"]
+    assert isinstance(results["show a"], SSHResult)
+    assert results["show a"].stdout == "output a\n"
+    assert isinstance(results["show b"], socket.timeout)
+    assert [r.message for r in caplog.records] == ["batch_command_failed"]
+
+
+def _device_with_password(password):
+    return Device(
+        id="sw1", host="10.0.0.1", username="admin",
+        auth=AuthPasswordInline(type="password_inline", password=password),
+    )
+
+
+def test_pooled_connections_are_not_shared_across_credentials(fake_ssh):
+    runner = fake_ssh.runner(pool_connections=True)
+
+    runner.run(_device_with_password("zone-1-secret"), "show system")
+    runner.run(_device_with_password("zone-2-secret"), "show system")
+    runner.run(_device_with_password("zone-1-secret"), "show system")
+
+    assert len(fake_ssh.clients) == 2
+    assert [len(c.commands) for c in fake_ssh.clients] == [2, 1]
+
+
+def test_stale_pooled_connection_is_retried_once(fake_ssh, device):
+    fake_ssh.outputs["show system"] = b"System:\n"
+    runner = fake_ssh.runner(pool_connections=True)
+    runner.run(device, "show system")
+    fake_ssh.clients[0].dead_on_exec = True
+
+    result = runner.run(device, "show system")
+
+    assert result.stdout == "System:\n"
+    assert len(fake_ssh.clients) == 2
+    assert fake_ssh.clients[1].commands == ["show system"]
+
+
+def test_run_batch_retries_commands_lost_to_a_stale_connection(fake_ssh, device):
+    fake_ssh.outputs["show a"] = b"a\n"
+    fake_ssh.outputs["show b"] = b"b\n"
+    runner = fake_ssh.runner(pool_connections=True, max_parallel_channels=2)
+    runner.run(device, "show a")
+    fake_ssh.clients[0].dead_on_exec = True
+
+    results = runner.run_batch(device, ["show a", "show b"])
+
+    assert {c: r.stdout for c, r in results.items()} == {"show a": "a\n", "show b": "b\n"}
+    assert len(fake_ssh.clients) == 2
+
+
+def test_stream_lines_decodes_utf8_split_across_chunks(fake_ssh, device):
+    # "é" and "ï" are each split between two recv() chunks
+    fake_ssh.outputs["show config"] = [b"caf\xc3", b"\xa9\nna", b"\xc3\xafve\n", b"tail"]
+    runner = fake_ssh.runner()
+
+    lines = list(runner.stream_lines(device, "show config"))
+
+    assert lines == ["café\n", "naïve\n", "tail"]
+    assert fake_ssh.clients[0].channels[0].closed
+
+
+def test_closing_stream_lines_early_closes_the_channel(fake_ssh, device):
+    fake_ssh.outputs["show mac"] = [b"line 1\n", b"line 2\n", b"line 3\n"]
+    runner = fake_ssh.runner(pool_connections=True)
+
+    lines = runner.stream_lines(device, "show mac")
+    assert next(lines) == "line 1\n"
+    lines.close()
+
+    channel = fake_ssh.clients[0].channels[0]
+    assert channel.closed
+    assert channel.chunks == [b"line 2\n", b"line 3\n"]
+
+
+def test_waiting_for_a_busy_switch_times_out(fake_ssh, device):
+    fake_ssh.outputs["show mac"] = [b"line 1\n", b"line 2\n"]
+    fake_ssh.outputs["show system"] = b"ok"
+    runner = fake_ssh.runner(max_parallel_per_host=1, connect_timeout_s=0)
+
+    lines = runner.stream_lines(device, "show mac")
+    assert next(lines) == "line 1\n"  # holds the host's only channel
+    with pytest.raises(SSHExecutionError, match="free SSH channel"):
+        runner.run(device, "show system")
+
+    lines.close()
+    assert runner.run(device, "show system").stdout == "ok"
+
+
+def test_run_closes_truncated_and_timed_out_channels(fake_ssh, device):
+    fake_ssh.outputs["show big"] = b"x" * 100
+    fake_ssh.outputs["show slow"] = [b"partial", socket.timeout("timed out")]
+    runner = fake_ssh.runner(pool_connections=True, max_output_bytes=10)
+
+    assert runner.run(device, "show big").truncated
+    with pytest.raises(SSHExecutionError):
+        runner.run(device, "show slow")
+
+    assert [c.closed for c in fake_ssh.clients[0].channels] == [True, True]
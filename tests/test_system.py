@@ -0,0 +1,59 @@
+import time
+
+from aos_server.tools import call_tool
+
+
+def test_config_backup_flags_truncated_output(fake_ssh, cfg, monkeypatch):
+    monkeypatch.setenv("AOS_DEVICE_PASSWORD", "secret")
+    fake_ssh.outputs["write terminal"] = b"! Chassis:\nsystem name SW-CORE-01\nvlan 10 admin-state enable\n"
+    runner = fake_ssh.runner(max_output_bytes=30)
+
+    result = call_tool(cfg, None, runner, None, "aos.config.backup", {"host": "10.0.0.1", "content": "summary"})
+
+    assert result["config"] == "! Chassis:\nsystem name SW-CORE"
+    assert result["truncated"] is True
+    assert "output truncated" in result["content"][0]["text"]
+
+
+BACKUP_OUTPUTS = {"write terminal": "! Chassis:\nsystem name SW-CORE-01\n"}
+
+
+def _backup(cfg, runner, **args):
+    return call_tool(cfg, None, runner, None, "aos.config.backup", {"host": "10.0.0.1", **args})
+
+
+def test_config_backup_is_not_kept_unless_enabled(cfg, make_runner):
+    from aos_server.tools.system import _BACKUP_CACHE
+
+    runner = make_runner(BACKUP_OUTPUTS)
+
+    _backup(cfg, runner, max_age_s=60)
+    result = _backup(cfg, runner, max_age_s=60)
+
+    assert "cached" not in result
+    assert runner.calls == ["write terminal", "write terminal"]
+    assert len(_BACKUP_CACHE._entries) == 0
+
+
+def test_config_backup_reuse_is_opt_in_and_capped(cfg, make_runner, monkeypatch):
+    from aos_server.tools.system import _BACKUP_CACHE
+
+    cfg = cfg.model_copy(update={"cache": cfg.cache.model_copy(update={"config_backup_max_age_s": 30})})
+    runner = make_runner(BACKUP_OUTPUTS)
+
+    _backup(cfg, runner)
+    assert len(_BACKUP_CACHE._entries) == 0
+
+    first = _backup(cfg, runner, max_age_s=600)
+    second = _backup(cfg, runner, max_age_s=600)
+    assert second["cached"] is True
+    assert second["commands_executed"] == []
+    assert second["config_sha256"] == first["config_sha256"]
+
+    # Stored for the capped 30s only
+    now = time.monotonic() + 31
+    monkeypatch.setattr("aos_server.result_cache.time.monotonic", lambda: now)
+    monkeypatch.setattr("aos_server.tools.system.time.monotonic", lambda: now)
+    third = _backup(cfg, runner, max_age_s=600)
+    assert "cached" not in third
+    assert runner.calls.count("write terminal") == 3
@@ -0,0 +1,46 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aos_server import zone_auth
+from aos_server.zone_auth import ZoneAuthResolver, extract_zone_from_ip
+
+
+def _resolver(monkeypatch):
+    monkeypatch.setenv("GLOBAL_USER", "admin")
+    monkeypatch.setenv("GLOBAL_PASS", "secret")
+    return ZoneAuthResolver({"global": {"username_env": "GLOBAL_USER", "password_env": "GLOBAL_PASS"}})
+
+
+@pytest.mark.parametrize("host, zone", [
+    ("10.9.5.10", 9),
+    ("192.168.1.1", 168),
+    ("10.001.5.1", 1),  # zero-padded octets, as some inventories write them
+    ("010.009.005.010", 9),
+    ("10.256.5.1", None),
+    ("10.1.5", None),
+    ("10.1.5.1\n", None),
+    ("switch.example.com", None),
+])
+def test_extract_zone_from_ip(host, zone):
+    assert extract_zone_from_ip(host) == zone
+
+
+def test_credentials_are_cached_per_host(monkeypatch):
+    resolver = _resolver(monkeypatch)
+
+    assert resolver.get_primary_credentials("10.9.0.1") == ("admin", "secret")
+    monkeypatch.setenv("GLOBAL_PASS", "changed")
+    assert resolver.get_primary_credentials("10.9.0.1") == ("admin", "secret")
+
+
+def test_host_cache_is_bounded_under_concurrent_use(monkeypatch):
+    monkeypatch.setattr(zone_auth, "_HOST_CACHE_MAX", 8)
+    resolver = _resolver(monkeypatch)
+    hosts = [f"10.{i % 250}.0.{i % 200}" for i in range(2000)]
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(resolver.get_primary_credentials, hosts))
+
+    assert results == [("admin", "secret")] * len(hosts)
+    assert len(resolver._host_cache) <= 8